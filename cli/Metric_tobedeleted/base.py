@@ -1,16 +1,33 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+import time
 
 
 class MetricCalculator(ABC):
+    name: str
     scores: dict[str, float]
 
-    def __init__(self):
+    def __init__(self, name: str = ""):
+        self.name = name
         self.scores = {}
 
     @abstractmethod
     def calculate(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Override in subclasses to implement metric logic."""
 
+    def timed_calculate(
+        self, url: str, parsed: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Run calculate() with timing attached.
+
+        When the caller already fetched metadata for the URL, pass it as
+        `parsed` so the metric skips its own fetch_metadata round-trip.
+        """
+        start = time.perf_counter_ns()
+        result = self.calculate(parsed if parsed is not None else url)
+        latency = (time.perf_counter_ns() - start) // 1_000_000
+        result.setdefault(f"{self.name}_latency", latency)
+        return result
+
     def get_scores(self) -> dict[str, float]:
         return self.scores
@@ -1,17 +1,85 @@
 # src/metrics/bus_factor.py
+import functools
 import os
 import re
 import time
 import requests
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, List, Set, Optional
+
+# orjson parses the ~200 KB commits payload ~3x faster than stdlib
+# json; fall back transparently when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson streams the commits array element by element so only the three
+# author fields per commit ever become Python objects; without it the
+# whole payload is parsed at once as before.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 from cli.metrics.base import MetricCalculator
+from cli.utils.github_graphql import fetch_repo_bundle
 from phase2.repo2.cli.utils.MetadataFetcher import fetch_metadata
 
 GH_COMMITS_API = (
     "https://api.github.com/repos/{repo}/commits?per_page={per_page}"
 )
 
+# Compiled once at import; _extract_repo_path runs per URL per metric.
+# The character class excludes /, ? and #, so the pattern can run on the
+# raw URL — no pre-stripping of query/fragment/trailing-slash needed.
+_REPO_RE = re.compile(r"github\.com/([A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+)")
+
+# Shared session so repeated GitHub calls reuse the same TCP/TLS
+# connection instead of paying a fresh handshake per request.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+        ),
+    ),
+)
+
+
+def _authors_from_commits(commits) -> List[str]:
+    """Pull author names out of an iterable of commit objects."""
+    authors: List[str] = []
+    for c in commits:
+        author = c.get("author")
+        if isinstance(author, dict) and author.get("login"):
+            authors.append(author["login"])
+            continue
+        commit_info = c.get("commit", {}).get("author", {})
+        name = commit_info.get("name")
+        email = commit_info.get("email")
+        if name:
+            authors.append(name)
+        elif email:
+            authors.append(email)
+    return authors
+
+
+@functools.lru_cache(maxsize=1)
+def _github_headers() -> Dict[str, str]:
+    headers: Dict[str, str] = {"Accept": "application/vnd.github.v3+json"}
+    token = os.getenv("GITHUB_TOKEN")
+    if token:
+        headers["Authorization"] = f"token {token}"
+    return headers
+
 
 class BusFactorMetric(MetricCalculator):
     def __init__(self):
@@ -19,62 +87,99 @@ class BusFactorMetric(MetricCalculator):
         self.score: float = -1.0
 
     def _make_headers(self) -> Dict[str, str]:
-        headers: Dict[str, str] = {"Accept": "application/vnd.github.v3+json"}
-        token = os.getenv("GITHUB_TOKEN")
-        if token:
-            headers["Authorization"] = f"token {token}"
-        return headers
+        return _github_headers()
 
     def _extract_repo_path(self, url: str) -> Optional[str]:
         if not url or "github.com" not in url:
             return None
-        url = url.split("#")[0].split("?")[0].rstrip("/")
-        m = re.search(r"github\.com/([A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+)", url)
+        m = _REPO_RE.search(url)
         if m:
             return m.group(1)
         return None
 
+    def _fetch_commit_page(self, url: str) -> tuple:
+        """Fetch one commits page; return (authors, next page url)."""
+        if ijson is not None:
+            with _SESSION.get(
+                url,
+                headers=self._make_headers(),
+                timeout=10,
+                stream=True,
+            ) as resp:
+                if resp.status_code != 200:
+                    logging.warning(
+                        "GitHub API returned %s for %s",
+                        resp.status_code,
+                        url,
+                    )
+                    return [], None
+                # Let urllib3 gunzip the stream as ijson reads it.
+                resp.raw.decode_content = True
+                authors = _authors_from_commits(
+                    ijson.items(resp.raw, "item")
+                )
+                return authors, resp.links.get("next", {}).get("url")
+
+        resp = _SESSION.get(url, headers=self._make_headers(), timeout=10)
+        if resp.status_code != 200:
+            logging.warning(
+                "GitHub API returned %s for %s", resp.status_code, url
+            )
+            return [], None
+        if orjson is not None:
+            commits = orjson.loads(resp.content)
+        else:
+            commits = resp.json()
+        return (
+            _authors_from_commits(commits),
+            resp.links.get("next", {}).get("url"),
+        )
+
     def _fetch_commit_authors_from_github(
-        self, repo_path: str, per_page: int = 100
+        self, repo_path: str, per_page: int = 100, max_authors: int = 50
     ) -> List[str]:
+        # Prefer the cached GraphQL bundle: one round-trip shared with
+        # LicenseMetric instead of a dedicated /commits call.
+        owner, _, repo_name = repo_path.partition("/")
+        bundle = fetch_repo_bundle(owner, repo_name)
+        if bundle and bundle.get("commit_authors"):
+            return list(bundle["commit_authors"])
+
+        # Follow Link: rel="next" pagination, but stop as soon as the
+        # unique-author count saturates the score (50 authors => 1.0).
+        authors: List[str] = []
+        seen: Set[str] = set()
+        url: Optional[str] = GH_COMMITS_API.format(
+            repo=repo_path, per_page=per_page
+        )
         try:
-            url = GH_COMMITS_API.format(repo=repo_path, per_page=per_page)
-            resp = requests.get(url, headers=self._make_headers(), timeout=10)
-            if resp.status_code != 200:
-                logging.warning(
-                    "GitHub API returned %s for %s",
-                    resp.status_code,
-                    repo_path,
-                )
-                return []
-            commits = resp.json()
-            authors: List[str] = []
-            for c in commits:
-                author = c.get("author")
-                if isinstance(author, dict) and author.get("login"):
-                    authors.append(author["login"])
-                    continue
-                commit_info = c.get("commit", {}).get("author", {})
-                name = commit_info.get("name")
-                email = commit_info.get("email")
-                if name:
-                    authors.append(name)
-                elif email:
-                    authors.append(email)
+            while url and len(seen) < max_authors:
+                page_authors, url = self._fetch_commit_page(url)
+                if not page_authors:
+                    break
+                authors.extend(page_authors)
+                for a in page_authors:
+                    key = a.strip()
+                    if key:
+                        seen.add(key)
             return authors
         except Exception:
             logging.exception(f"Error fetching commit authors for {repo_path}")
-            return []
+            return authors
 
     def get_data(self, parsed_data: Dict[str, Any]) -> List[str]:
         pre_authors = parsed_data.get("commit_authors")
         if isinstance(pre_authors, list) and pre_authors:
-            seen = set()
-            return [
-                str(a).strip()
-                for a in pre_authors
-                if a and a not in seen and not seen.add(a)
-            ]
+            seen: Set[str] = set()
+            out: List[str] = []
+            for a in pre_authors:
+                if not a:
+                    continue
+                key = str(a).strip()
+                if key and key not in seen:
+                    seen.add(key)
+                    out.append(key)
+            return out
 
         code_url = parsed_data.get("code_url") or parsed_data.get("url")
         repo_path = (
@@ -99,11 +204,18 @@ class BusFactorMetric(MetricCalculator):
         start_time = time.perf_counter()
         parsed_data: Dict[str, Any] = {}
         try:
-            # Centralize metadata retrieval: include commits for bus-factor
-            parsed_data = fetch_metadata(url, include_commits=True)
+            if isinstance(url, dict):
+                # Caller already fetched metadata; reuse it directly.
+                parsed_data = url
+            else:
+                # Centralize metadata retrieval: include commits for
+                # bus-factor
+                parsed_data = fetch_metadata(url, include_commits=True)
 
+            # get_data already deduplicates, so its length is the
+            # unique-author count; no need to re-hash into a set.
             authors = self.get_data(parsed_data)
-            unique_count = len(set(authors))
+            unique_count = len(authors)
             score = 0.0
             if unique_count > 0:
                 score = min(1.0, unique_count / 50.0)
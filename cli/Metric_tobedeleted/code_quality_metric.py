@@ -1,5 +1,10 @@
 # src/metrics/code_quality.py
+import functools
+import gzip
+import hashlib
+import json
 import os
+import re
 import time
 import logging
 from typing import Any, Dict, List, Optional
@@ -14,6 +19,168 @@ from phase2.repo2.cli.utils.MetadataFetcher import (
 )
 
 
+# One compiled pattern per category: a single C-level scan per path
+# instead of ~25 Python-level startswith/endswith/in checks. Patterns
+# mirror the original chained conditions exactly (paths are lowercased
+# before matching).
+_TESTS_RE = re.compile(r"(?:^|/)tests?/|(?:^|/)test_|test\.py$")
+_CI_RE = re.compile(
+    r"^\.github/workflows|\.travis\.yml$|\.circleci/|"
+    r"azure-pipelines\.yml$|jenkinsfile$|(?:^|/)ci/|"
+    r"^makefile$|^dockerfile$"
+)
+_LINT_RE = re.compile(
+    r"^(?:\.flake8|setup\.cfg|pyproject\.toml|tox\.ini|\.pylintrc)$|"
+    r"lint\.py$|format\.py$"
+)
+_README_RE = re.compile(r"^readme")
+
+# Shared session: keep-alive to api.github.com across tree fetches.
+_SESSION = requests.Session()
+
+# Both helpers are pure functions of the URL string; memoize so the
+# same URL is only parsed/classified once across all eight metrics.
+_classify_url_cached = functools.lru_cache(maxsize=4096)(classify_url)
+_extract_repo_cached = functools.lru_cache(maxsize=4096)(
+    extract_github_repo
+)
+_PACKAGING_RE = re.compile(
+    r"^(?:setup\.py|pyproject\.toml|requirements\.txt|pipfile)$|"
+    r"^requirements.*\.txt$"
+)
+
+# Bit per category: the tree loop accumulates all five findings in one
+# int with |= instead of five named booleans, and bails out of pattern
+# probing once every bit is set (_ALL_BITS).
+_TESTS_BIT = 1
+_CI_BIT = 2
+_LINT_BIT = 4
+_README_BIT = 8
+_PACKAGING_BIT = 16
+_ALL_BITS = 31
+
+# Multiline anchor: counts ".py" line endings in one C-level scan over
+# the newline-joined path blob (paths never contain newlines).
+_PY_COUNT_RE = re.compile(r"\.py$", re.M)
+
+# ETag cache for repo trees, persisted across CLI invocations. GitHub
+# answers If-None-Match with 304 (which does not count against the rate
+# limit) when the tree is unchanged, so we only pay for real downloads.
+# One gzipped file per (repo, branch): only the repos actually touched
+# in a run are read or written — tree bodies can run to 100k entries,
+# so a monolithic file would mean a huge JSON parse at import and a
+# wholesale rewrite at exit.
+_ETAG_CACHE_DIR = os.path.expanduser("~/.cache/phase2swe/tree-etags")
+# Pruned least-recently-used first; revalidations refresh the mtime.
+_ETAG_CACHE_MAX = 128
+
+
+def _etag_entry_path(cache_key: str) -> str:
+    digest = hashlib.sha1(cache_key.encode("utf-8")).hexdigest()
+    return os.path.join(_ETAG_CACHE_DIR, digest + ".json.gz")
+
+
+def _load_etag_entry(cache_key: str) -> Optional[List[Any]]:
+    """Read one [etag, tree] entry, or None if absent/corrupt."""
+    try:
+        path = _etag_entry_path(cache_key)
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return None
+
+
+def _store_etag_entry(cache_key: str, etag: str, tree: Any) -> None:
+    # Best effort: a failed write just means a re-download next run.
+    try:
+        os.makedirs(_ETAG_CACHE_DIR, exist_ok=True)
+        path = _etag_entry_path(cache_key)
+        with gzip.open(path, "wt", encoding="utf-8") as fh:
+            json.dump([etag, tree], fh)
+        _prune_etag_cache()
+    except OSError:
+        logging.debug("Could not persist tree ETag entry", exc_info=True)
+
+
+def _touch_etag_entry(cache_key: str) -> None:
+    # A 304 proves the entry is still hot: refresh its mtime so the
+    # pruner doesn't treat the most revalidated repos as the oldest.
+    try:
+        os.utime(_etag_entry_path(cache_key))
+    except OSError:
+        pass
+
+
+def _prune_etag_cache() -> None:
+    """Drop the least recently used entries beyond _ETAG_CACHE_MAX."""
+    try:
+        with os.scandir(_ETAG_CACHE_DIR) as it:
+            entries = [
+                (e.stat().st_mtime, e.path) for e in it if e.is_file()
+            ]
+    except OSError:
+        return
+    excess = len(entries) - _ETAG_CACHE_MAX
+    if excess <= 0:
+        return
+    for _, path in sorted(entries)[:excess]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class _TreeFetchError(Exception):
+    """Raised on fetch failure so lru_cache never memoizes it."""
+
+
+def _fetch_repo_tree(
+    repo_path: str, branch: str = "HEAD"
+) -> Optional[List[Dict[str, Any]]]:
+    """Fetch a repo tree, memoizing successes but retrying failures."""
+    try:
+        return _fetch_repo_tree_cached(repo_path, branch)
+    except _TreeFetchError:
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _fetch_repo_tree_cached(
+    repo_path: str, branch: str = "HEAD"
+) -> List[Dict[str, Any]]:
+    """Fetch a repo's recursive tree once per (repo, branch)."""
+    url = (
+        f"https://api.github.com/repos/{repo_path}/git/trees/{branch}?"
+        "recursive=1"
+    )
+    headers: Dict[str, str] = {"Accept": "application/vnd.github.v3+json"}
+    token = os.getenv("GITHUB_TOKEN")
+    if token:
+        headers["Authorization"] = f"token {token}"
+    cache_key = f"{repo_path}@{branch}"
+    cached = _load_etag_entry(cache_key)
+    if cached:
+        headers["If-None-Match"] = cached[0]
+    try:
+        resp = _SESSION.get(url, headers=headers, timeout=10)
+    except Exception:
+        logging.exception(f"Error fetching repo tree for {repo_path}")
+        raise _TreeFetchError(repo_path)
+    if resp.status_code == 304 and cached:
+        _touch_etag_entry(cache_key)
+        return cached[1]
+    if resp.status_code == 200:
+        tree = resp.json().get("tree", [])
+        etag = resp.headers.get("ETag")
+        if etag:
+            _store_etag_entry(cache_key, etag, tree)
+        return tree
+    logging.warning(
+        "GitHub API returned %s for %s", resp.status_code, repo_path
+    )
+    raise _TreeFetchError(repo_path)
+
+
 class CodeQualityMetric(MetricCalculator):
     """Assess repository code quality by looking at tests, CI, linting,
     docs, and packaging.
@@ -33,21 +200,7 @@ class CodeQualityMetric(MetricCalculator):
     def _fetch_repo_tree(
         self, repo_path: str, branch: str = "HEAD"
     ) -> Optional[List[Dict[str, Any]]]:
-        url = (
-            f"https://api.github.com/repos/{repo_path}/git/trees/{branch}?"
-            "recursive=1"
-        )
-        try:
-            resp = requests.get(url, headers=self._make_headers(), timeout=10)
-            if resp.status_code == 200:
-                return resp.json().get("tree", [])
-            logging.warning(
-                "GitHub API returned %s for %s", resp.status_code, repo_path
-            )
-            return None
-        except Exception:
-            logging.exception(f"Error fetching repo tree for {repo_path}")
-            return None
+        return _fetch_repo_tree(repo_path, branch)
 
     def get_data(self, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
         url = parsed_data.get("url", "")
@@ -57,7 +210,7 @@ class CodeQualityMetric(MetricCalculator):
         repo_url = code_url or url
 
         # Only proceed for code or model URLs that point to a repo
-        if not repo_url or classify_url(repo_url) not in (CODE, MODEL):
+        if not repo_url or _classify_url_cached(repo_url) not in (CODE, MODEL):
             return {
                 "has_tests": False,
                 "has_ci": False,
@@ -67,7 +220,7 @@ class CodeQualityMetric(MetricCalculator):
                 "has_packaging": False,
             }
 
-        repo = extract_github_repo(repo_url)
+        repo = _extract_repo_cached(repo_url)
         if not repo:
             logging.error("Could not parse repo URL: %s", repo_url)
             return {
@@ -96,86 +249,38 @@ class CodeQualityMetric(MetricCalculator):
                 "has_packaging": False,
             }
 
-        has_tests = False
-        has_ci = False
-        has_lint_config = False
-        has_readme = False
-        has_packaging = False
-        python_file_count = 0
-
-        for entry in tree:
-            path = entry.get("path", "").lower()
-            if (
-                path.startswith("tests/")
-                or "/tests/" in path
-                or path.startswith("test/")
-                or "/test/" in path
-                or path.startswith("test_")
-                or "/test_" in path
-                or path.endswith("_test.py")
-                or path.endswith("test.py")
-            ):
-                has_tests = True
-
-            if (
-                path.startswith(".github/workflows")
-                or path.endswith(".travis.yml")
-                or ".circleci/" in path
-                or path.endswith("azure-pipelines.yml")
-                or path.endswith("jenkinsfile")
-                or path.startswith("ci/")
-                or "/ci/" in path
-                or path == "makefile"
-                or path == "dockerfile"
-            ):
-                has_ci = True
-
-            if (
-                path
-                in {
-                    ".flake8",
-                    "setup.cfg",
-                    "pyproject.toml",
-                    "tox.ini",
-                    ".pylintrc",
-                }
-                or path.endswith("lint.py")
-                or path.endswith("format.py")
-            ):
-                has_lint_config = True
-
-            if (
-                path.startswith("readme")
-                or path in {"readme.md", "readme.rst", "readme.txt"}
-            ):
-                has_readme = True
-
-            if (
-                path in {
-                    "setup.py",
-                    "pyproject.toml",
-                    "requirements.txt",
-                    "pipfile",
-                }
-                or path.startswith("requirements")
-                and path.endswith(".txt")
-            ):
-                has_packaging = True
-
-            if path.endswith(".py"):
-                python_file_count += 1
+        paths = [entry.get("path", "").lower() for entry in tree]
+
+        flags = 0
+        # Once all five bits are set the probe loop can stop outright;
+        # the .py count below no longer depends on it.
+        for path in paths:
+            if not flags & _TESTS_BIT and _TESTS_RE.search(path):
+                flags |= _TESTS_BIT
+            if not flags & _CI_BIT and _CI_RE.search(path):
+                flags |= _CI_BIT
+            if not flags & _LINT_BIT and _LINT_RE.search(path):
+                flags |= _LINT_BIT
+            if not flags & _README_BIT and _README_RE.match(path):
+                flags |= _README_BIT
+            if not flags & _PACKAGING_BIT and _PACKAGING_RE.match(path):
+                flags |= _PACKAGING_BIT
+            if flags == _ALL_BITS:
+                break
+
+        python_file_count = len(_PY_COUNT_RE.findall("\n".join(paths)))
 
         return {
-            "has_tests": has_tests,
-            "has_ci": has_ci,
-            "has_lint_config": has_lint_config,
+            "has_tests": bool(flags & _TESTS_BIT),
+            "has_ci": bool(flags & _CI_BIT),
+            "has_lint_config": bool(flags & _LINT_BIT),
             "python_file_count": python_file_count,
-            "has_readme": has_readme,
-            "has_packaging": has_packaging,
+            "has_readme": bool(flags & _README_BIT),
+            "has_packaging": bool(flags & _PACKAGING_BIT),
         }
 
     def calculate(self, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         try:
             parsed = {}
             if isinstance(parsed_data, str):
@@ -222,8 +327,8 @@ class CodeQualityMetric(MetricCalculator):
             logging.exception("Error in CodeQualityMetric.calculate")
             self.score = 0.0
 
-        latency = (time.perf_counter() - start) * 1000.0
+        latency = (time.perf_counter_ns() - start) // 1_000_000
         return {
             self.name: round(self.score, 2),
-            f"{self.name}_latency": int(latency),
+            f"{self.name}_latency": latency,
         }
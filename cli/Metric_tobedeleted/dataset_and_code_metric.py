@@ -234,7 +234,12 @@ class DatasetAndCodeMetric(MetricCalculator):
     def calculate(self, url: str) -> Dict[str, Any]:
         score = 0.0
         try:
-            parsed_data: Dict[str, Any] = fetch_metadata(url)
+            parsed_data: Dict[str, Any] = {}
+            if isinstance(url, dict):
+                # Caller already fetched metadata; reuse it directly.
+                parsed_data = url
+            else:
+                parsed_data = fetch_metadata(url)
 
             data = self.get_data(parsed_data)
             self.calculate_score(data)
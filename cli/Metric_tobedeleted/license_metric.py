@@ -1,11 +1,16 @@
 # src/metrics/license_metric.py
-import base64
+import functools
+import re
 import requests
 import os
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Any, Dict, Optional
 from cli.metrics.base import MetricCalculator
+from cli.utils.github_graphql import fetch_repo_bundle
 from phase2.repo2.cli.utils.MetadataFetcher import (
     classify_url,
     extract_github_repo,
@@ -31,6 +36,88 @@ MEDIUM_QUALITY_LICENSES = {
 CUSTOM_LICENSE_KEYWORD = "custom"
 UNKNOWN_LICENSE = "unknown"
 
+# Union built once at import — query many, build never again.
+_ALL_LICENSES = HIGH_QUALITY_LICENSES | MEDIUM_QUALITY_LICENSES
+
+# Map the human-readable form ("apache 2.0") back to its canonical id,
+# longest keywords first so e.g. "bsd 3 clause" wins over "bsd 2 clause"
+# prefixes. One compiled alternation scans the README in a single pass
+# instead of one substring scan per known license.
+_LICENSE_KEYWORDS = {
+    lic.replace("-", " "): lic
+    for lic in sorted(_ALL_LICENSES, key=len, reverse=True)
+}
+_LICENSE_RE = re.compile(
+    "|".join(re.escape(k) for k in _LICENSE_KEYWORDS)
+)
+
+# Single normalized-license -> score table: one hash lookup instead of
+# two set membership checks plus the custom/unknown branches.
+_LICENSE_SCORE = {
+    **{lic: 1.0 for lic in HIGH_QUALITY_LICENSES},
+    **{lic: 0.7 for lic in MEDIUM_QUALITY_LICENSES},
+    UNKNOWN_LICENSE: 0.2,
+}
+
+# Shared session so the license + readme lookups reuse one pooled
+# TCP/TLS connection to api.github.com.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+        ),
+    ),
+)
+
+
+# Prefetch pool: the README fallback download runs while the license
+# endpoint is still in flight instead of after it fails.
+_EXEC = ThreadPoolExecutor(max_workers=8)
+
+
+def _fetch_readme_capped(
+    owner: str, repo_name: str, max_bytes: int = 262144
+) -> Optional[str]:
+    """Stream the raw README, reading at most ``max_bytes``.
+
+    License mentions live in the front matter, so multi-MB model cards
+    never need to be pulled (or decoded) in full.
+    """
+    with _SESSION.get(
+        f"https://api.github.com/repos/{owner}/{repo_name}/readme",
+        headers={
+            **_github_headers(),
+            "Accept": "application/vnd.github.v3.raw",
+        },
+        timeout=5,
+        stream=True,
+    ) as resp:
+        if resp.status_code != 200:
+            return None
+        buf = bytearray()
+        for chunk in resp.iter_content(chunk_size=16384):
+            buf.extend(chunk)
+            if len(buf) >= max_bytes:
+                break
+        return bytes(buf[:max_bytes]).decode(
+            resp.encoding or "utf-8", errors="replace"
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def _github_headers() -> Dict[str, str]:
+    headers: Dict[str, str] = {}
+    token = os.getenv("GITHUB_TOKEN")
+    if token:
+        headers["Authorization"] = f"token {token}"
+    return headers
+
 
 class LicenseMetric(MetricCalculator):
     """Evaluate the quality of a repository's license."""
@@ -47,17 +134,34 @@ class LicenseMetric(MetricCalculator):
 
         url = parsed_data.get("url", "")
         kind = classify_url(url)
-        headers = {}
-        token = os.getenv("GITHUB_TOKEN")
-        if token:
-            headers["Authorization"] = f"token {token}"
+        headers = _github_headers()
 
         if kind == CODE:
             repo = extract_github_repo(url)
             if repo:
                 owner, repo_name = repo.split("/")
+
+                # Prefer the cached GraphQL bundle: one round-trip shared
+                # with BusFactorMetric instead of /license + /readme.
+                bundle = fetch_repo_bundle(owner, repo_name)
+                if bundle:
+                    spdx = bundle.get("spdx_id")
+                    if spdx and spdx != "NOASSERTION":
+                        return spdx
+                    readme_text = bundle.get("readme_text")
+                    if readme_text:
+                        m = _LICENSE_RE.search(readme_text.lower())
+                        if m:
+                            return _LICENSE_KEYWORDS[m.group(0)]
+
+                # Start the README download now so its latency overlaps
+                # the license endpoint's; it's only awaited on fallback.
+                readme_fut = _EXEC.submit(
+                    _fetch_readme_capped, owner, repo_name
+                )
+
                 try:
-                    resp = requests.get(
+                    resp = _SESSION.get(
                         f"https://api.github.com/repos/{owner}/{repo_name}/"
                         "license",
                         headers=headers,
@@ -67,6 +171,7 @@ class LicenseMetric(MetricCalculator):
                         data = resp.json()
                         spdx = data.get("license", {}).get("spdx_id")
                         if spdx and spdx != "NOASSERTION":
+                            readme_fut.cancel()
                             return spdx
                 except Exception:
                     logging.exception(
@@ -74,22 +179,13 @@ class LicenseMetric(MetricCalculator):
                     )
 
                 try:
-                    resp = requests.get(
-                        f"https://api.github.com/repos/{owner}/{repo_name}/"
-                        "readme",
-                        headers=headers,
-                        timeout=5,
-                    )
-                    if resp.status_code == 200:
-                        readme_data = resp.json()
-                        content = base64.b64decode(
-                            readme_data.get("content", "")
-                        ).decode("utf-8", errors="ignore")
-                        for lic in (
-                            HIGH_QUALITY_LICENSES | MEDIUM_QUALITY_LICENSES
-                        ):
-                            if lic.replace("-", " ") in content.lower():
-                                return lic
+                    # Raw blob, streamed and capped: no JSON envelope, no
+                    # base64 pass, and at most 256 KiB pulled off the wire.
+                    readme_text = readme_fut.result(timeout=10)
+                    if readme_text:
+                        m = _LICENSE_RE.search(readme_text.lower())
+                        if m:
+                            return _LICENSE_KEYWORDS[m.group(0)]
                 except Exception:
                     logging.exception("Error scanning README for %s", repo)
 
@@ -99,22 +195,20 @@ class LicenseMetric(MetricCalculator):
         """Accept a URL string, fetch supporting data if needed, and score."""
         start_time = time.perf_counter()
         try:
-            parsed_data = fetch_metadata(url)
+            if isinstance(url, dict):
+                # Caller already fetched metadata; reuse it directly.
+                parsed_data = url
+            else:
+                parsed_data = fetch_metadata(url)
             license_str = self.get_data(parsed_data)
 
             score = 0.0
             if license_str:
                 norm = license_str.strip().lower()
-                if norm in HIGH_QUALITY_LICENSES:
-                    score = 1.0
-                elif norm in MEDIUM_QUALITY_LICENSES:
-                    score = 0.7
-                elif CUSTOM_LICENSE_KEYWORD in norm:
-                    score = 0.5
-                elif norm == UNKNOWN_LICENSE:
-                    score = 0.2
-                else:
-                    score = 0.2
+                score = _LICENSE_SCORE.get(
+                    norm,
+                    0.5 if CUSTOM_LICENSE_KEYWORD in norm else 0.2,
+                )
             self.score = score
         except Exception:
             logging.exception("Error in LicenseMetric.calculate for %s", url)
@@ -5,6 +5,17 @@ import logging
 from cli.metrics.base import MetricCalculator
 from phase2.repo2.cli.utils.MetadataFetcher import fetch_metadata
 
+# Built once at import; calculate_score scans tags per URL.
+_PERF_TAGS = (
+    "arxiv:",
+    "leaderboard",
+    "benchmark",
+    "evaluation",
+    "sota",
+    "state-of-the-art",
+    "performance",
+)
+
 
 class PerformanceClaimsMetric(MetricCalculator):
     """Evaluate evidence of performance claims for a given model."""
@@ -45,17 +56,14 @@ class PerformanceClaimsMetric(MetricCalculator):
                     break
 
         tags = data.get("tags", [])
-        perf_tags = [
-            "arxiv:",
-            "leaderboard",
-            "benchmark",
-            "evaluation",
-            "sota",
-            "state-of-the-art",
-            "performance",
-        ]
-        if any(any(pt in tag.lower() for pt in perf_tags) for tag in tags if isinstance(tag, str)):
-            score += 0.25
+        for tag in tags:
+            if not isinstance(tag, str):
+                continue
+            # Lowercase once per tag instead of once per keyword probe.
+            t = tag.lower()
+            if any(pt in t for pt in _PERF_TAGS):
+                score += 0.25
+                break
 
         card_data = data.get("cardData", {})
         if isinstance(card_data, dict) and card_data.get("model-index", []) and not model_index:
@@ -88,8 +96,15 @@ class PerformanceClaimsMetric(MetricCalculator):
                 # fetch_metadata will return a metadata dict for HF models
                 parsed_data = fetch_metadata(url) or {"url": url}
 
-            data = self.get_data(parsed_data)
-            self.calculate_score(data)
+            # Non-model URLs always score 0.0 — skip building the data
+            # dict (model_index/tags/cardData extraction) entirely.
+            category = parsed_data.get("category", "UNKNOWN")
+            if category != "MODEL":
+                self.score = 0.0
+                logging.info("Not a MODEL entry -> score=0.0")
+            else:
+                data = self.get_data(parsed_data)
+                self.calculate_score(data)
         except Exception as e:
             self.score = 0.0
             logging.error(
@@ -1,79 +1,156 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+import bisect
 import logging
 from cli.metrics.base import MetricCalculator
 from phase2.repo2.cli.utils.MetadataFetcher import fetch_metadata
 
+# Indicator lists hoisted to module scope — built once, scanned often.
+_QUICK_START_INDICATORS = (
+    "quick start", "getting started", "quickstart",
+    "installation", "usage", "example", "tutorial", "how to use"
+)
+_QUICK_START_FILES = (
+    "quickstart", "getting_started", "tutorial", "example",
+    "demo", "usage", "install"
+)
+_INSTALL_INDICATORS = (
+    "pip install", "conda install", "npm install", "yarn add",
+    "installation", "install", "setup", "requirements"
+)
+_INSTALL_FILES = (
+    "requirements.txt", "package.json", "setup.py", "pyproject.toml",
+    "environment.yml", "dockerfile", "makefile"
+)
+_EXAMPLE_FILES = (".py", ".ipynb", "example", "demo", "sample")
+_LIGHTWEIGHT_LIBS = frozenset({
+    "transformers", "diffusers", "sentence-transformers",
+    "sklearn", "numpy", "pytorch", "tensorflow"
+})
+_STANDALONE_INDICATORS = (
+    "no dependencies", "standalone", "zero dependencies",
+    "minimal setup", "plug and play"
+)
+_SIZE_INDICATORS = (
+    ("large", ("large", "xl", "big", "giant")),
+    ("medium", ("medium", "base", "standard")),
+    ("small", ("small", "mini", "tiny", "micro", "nano")),
+)
+_LARGE_DESC_WORDS = ("billion", "parameters", "large-scale")
+_SMALL_DESC_WORDS = ("lightweight", "efficient", "fast")
+_DOC_FILES = ("readme.md", "readme.txt", "readme.rst", "docs/", "documentation")
+_KNOWN_ARCHITECTURES = ("bert", "distilbert", "gpt", "whisper", "roberta", "t5")
+
+# Scoring tables: the old if/elif ladder in calculate_score, partially
+# evaluated at import time. The description-length rungs (>100, >150,
+# >300) become a bisect over cut points; complexity and the
+# category/examples interplay become direct lookups.
+_DOC_CUTS = (100, 150, 300)
+_DOC_BUCKETS = (0.10, 0.15, 0.25, 0.30)
+_COMPLEXITY_ADJ = {"small": 0.05, "medium": 0.0, "large": -0.05}
+_CATEGORY_ADJ = {
+    ("DATASET", True): 0.05,
+    ("DATASET", False): 0.05,
+    ("CODE", False): -0.05,
+}
+
 
 class RampUpMetric(MetricCalculator):
     def __init__(self):
         super().__init__("ramp_up_time")
         self.score: float = 0.0
 
-    def get_description(self, parsed_data: Dict[str, Any]) -> str:
-        description = parsed_data.get("description", "")
-        if not description:
-            metadata = parsed_data.get("metadata", {})
-            description = metadata.get("description", "")
-
-        if not description:
-            card_data = parsed_data.get("cardData", {})
-            description = card_data.get("model_description", "") or card_data.get("description", "")
-            if not description:
-                metadata = parsed_data.get("metadata", {})
-                card_data = metadata.get("cardData", {})
-                description = card_data.get("model_description", "") or card_data.get("description", "")
-
-        return description
-
-    def has_quick_start_guide(self, parsed_data: Dict[str, Any]) -> bool:
-        description = self.get_description(parsed_data).lower()
-        quick_start_indicators = [
-            "quick start", "getting started", "quickstart",
-            "installation", "usage", "example", "tutorial", "how to use"
+    def _prep(self, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the lowered views every has_* helper needs, once per URL.
+
+        The helpers used to re-derive description, siblings and tags on
+        each call (with a .lower() per item per predicate).
+        """
+        metadata = parsed_data.get("metadata", {})
+        siblings = (
+            parsed_data.get("siblings", []) or metadata.get("siblings", [])
+        )
+        filenames = [
+            s.get("rfilename", "").lower()
+            for s in siblings
+            if isinstance(s, dict)
         ]
+        tags = parsed_data.get("tags", []) or metadata.get("tags", [])
+        description = self.get_description(parsed_data)
+        return {
+            "description": description,
+            "description_lower": description.lower(),
+            "filenames": filenames,
+            # one joined blob lets each indicator be probed with a single
+            # substring scan instead of a per-filename loop (filenames
+            # never contain spaces, so matches can't span the separator)
+            "filename_blob": " ".join(filenames),
+            "tags": tags,
+            "tags_lower": [t.lower() for t in tags if isinstance(t, str)],
+        }
 
-        if any(indicator in description for indicator in quick_start_indicators):
-            return True
+    @staticmethod
+    def _tag_blob(prep: Dict[str, Any]) -> str:
+        # joined lazily and memoized on the prep dict: only the
+        # complexity/dependency helpers need substring matching on tags
+        blob = prep.get("tag_blob")
+        if blob is None:
+            blob = " ".join(prep["tags_lower"])
+            prep["tag_blob"] = blob
+        return blob
 
-        siblings = parsed_data.get("siblings", []) or parsed_data.get("metadata", {}).get("siblings", [])
-        quick_start_files = [
-            "quickstart", "getting_started", "tutorial", "example",
-            "demo", "usage", "install"
-        ]
+    def get_description(self, parsed_data: Dict[str, Any]) -> str:
+        # Lazy or-chain: the common case (top-level description) returns
+        # after one lookup; the fallback dicts are only built if needed.
+        # _prep caches the result per URL so helpers never re-walk this.
+        if parsed_data.get("description"):
+            return parsed_data["description"]
+        metadata = parsed_data.get("metadata", {})
+        if metadata.get("description"):
+            return metadata["description"]
+        card_data = parsed_data.get("cardData", {}) or {}
+        meta_card = metadata.get("cardData", {}) or {}
+        return (
+            card_data.get("model_description", "")
+            or card_data.get("description", "")
+            or meta_card.get("model_description", "")
+            or meta_card.get("description", "")
+        )
 
-        for sibling in siblings:
-            if isinstance(sibling, dict):
-                filename = sibling.get("rfilename", "").lower()
-                if any(qs_file in filename for qs_file in quick_start_files):
-                    return True
-        return False
+    def has_quick_start_guide(
+        self,
+        parsed_data: Dict[str, Any],
+        prep: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        prep = prep if prep is not None else self._prep(parsed_data)
+        description = prep["description_lower"]
+        if any(ind in description for ind in _QUICK_START_INDICATORS):
+            return True
 
-    def has_installation_instructions(self, parsed_data: Dict[str, Any]) -> bool:
-        description = self.get_description(parsed_data).lower()
-        install_indicators = [
-            "pip install", "conda install", "npm install", "yarn add",
-            "installation", "install", "setup", "requirements"
-        ]
-        if any(indicator in description for indicator in install_indicators):
+        blob = prep["filename_blob"]
+        return any(qs_file in blob for qs_file in _QUICK_START_FILES)
+
+    def has_installation_instructions(
+        self,
+        parsed_data: Dict[str, Any],
+        prep: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        prep = prep if prep is not None else self._prep(parsed_data)
+        description = prep["description_lower"]
+        if any(ind in description for ind in _INSTALL_INDICATORS):
             return True
 
-        tags = parsed_data.get("tags", []) or parsed_data.get("metadata", {}).get("tags", [])
-        if "transformers" in tags:
+        if "transformers" in prep["tags"]:
             return True
 
-        siblings = parsed_data.get("siblings", []) or parsed_data.get("metadata", {}).get("siblings", [])
-        install_files = [
-            "requirements.txt", "package.json", "setup.py", "pyproject.toml",
-            "environment.yml", "dockerfile", "makefile"
-        ]
-        for sibling in siblings:
-            if isinstance(sibling, dict):
-                filename = sibling.get("rfilename", "").lower()
-                if any(inst in filename for inst in install_files):
-                    return True
-        return False
+        blob = prep["filename_blob"]
+        return any(inst in blob for inst in _INSTALL_FILES)
 
-    def has_runnable_examples(self, parsed_data: Dict[str, Any]) -> bool:
+    def has_runnable_examples(
+        self,
+        parsed_data: Dict[str, Any],
+        prep: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        prep = prep if prep is not None else self._prep(parsed_data)
         widget_data = parsed_data.get("widgetData", []) or parsed_data.get("metadata", {}).get("widgetData", [])
         if widget_data:
             return True
@@ -82,78 +159,78 @@ class RampUpMetric(MetricCalculator):
         if transformers_info.get("auto_model"):
             return True
 
-        siblings = parsed_data.get("siblings", []) or parsed_data.get("metadata", {}).get("siblings", [])
-        example_files = [".py", ".ipynb", "example", "demo", "sample"]
-        for sibling in siblings:
-            if isinstance(sibling, dict):
-                filename = sibling.get("rfilename", "").lower()
-                if any(ex_file in filename for ex_file in example_files):
-                    return True
-        return False
-
-    def has_minimal_dependencies(self, parsed_data: Dict[str, Any]) -> bool:
-        tags = parsed_data.get("tags", []) or parsed_data.get("metadata", {}).get("tags", [])
-        lightweight_indicators = [
-            "transformers", "diffusers", "sentence-transformers",
-            "sklearn", "numpy", "pytorch", "tensorflow"
-        ]
-        if any(lib in t.lower() for t in tags for lib in lightweight_indicators):
+        blob = prep["filename_blob"]
+        return any(ex_file in blob for ex_file in _EXAMPLE_FILES)
+
+    def has_minimal_dependencies(
+        self,
+        parsed_data: Dict[str, Any],
+        prep: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        prep = prep if prep is not None else self._prep(parsed_data)
+        # exact-tag hits first (one set intersection), then one substring
+        # scan of the joined tag blob for compound tags like "large-v2"
+        if _LIGHTWEIGHT_LIBS.intersection(prep["tags_lower"]):
+            return True
+        tag_blob = self._tag_blob(prep)
+        if any(lib in tag_blob for lib in _LIGHTWEIGHT_LIBS):
             return True
 
-        description = self.get_description(parsed_data).lower()
-        standalone_indicators = ["no dependencies", "standalone", "zero dependencies", "minimal setup", "plug and play"]
-        if any(indicator in description for indicator in standalone_indicators):
+        description = prep["description_lower"]
+        if any(ind in description for ind in _STANDALONE_INDICATORS):
             return True
         return False
 
-    def get_model_complexity(self, parsed_data: Dict[str, Any]) -> str:
-        tags = parsed_data.get("tags", []) or parsed_data.get("metadata", {}).get("tags", [])
-        size_indicators = {
-            "large": ["large", "xl", "big", "giant"],
-            "medium": ["medium", "base", "standard"],
-            "small": ["small", "mini", "tiny", "micro", "nano"]
-        }
-        for size, indicators in size_indicators.items():
-            if any(ind in t.lower() for t in tags for ind in indicators):
+    def get_model_complexity(
+        self,
+        parsed_data: Dict[str, Any],
+        prep: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        prep = prep if prep is not None else self._prep(parsed_data)
+        tag_blob = self._tag_blob(prep)
+        for size, indicators in _SIZE_INDICATORS:
+            if any(ind in tag_blob for ind in indicators):
                 return size
 
-        description = self.get_description(parsed_data).lower()
-        if any(word in description for word in ["billion", "parameters", "large-scale"]):
+        description = prep["description_lower"]
+        if any(word in description for word in _LARGE_DESC_WORDS):
             return "large"
-        elif any(word in description for word in ["lightweight", "efficient", "fast"]):
+        elif any(word in description for word in _SMALL_DESC_WORDS):
             return "small"
         return "medium"
 
-    def has_clear_documentation(self, parsed_data: Dict[str, Any]) -> bool:
-        description = self.get_description(parsed_data)
-        tags = parsed_data.get("tags", []) or parsed_data.get("metadata", {}).get("tags", [])
-        known_architectures = ["bert", "distilbert", "gpt", "whisper", "roberta", "t5"]
-        is_known_architecture = any(arch in tag.lower() for tag in tags for arch in known_architectures)
+    def has_clear_documentation(
+        self,
+        parsed_data: Dict[str, Any],
+        prep: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        prep = prep if prep is not None else self._prep(parsed_data)
+        description = prep["description"]
+        is_known_architecture = any(
+            arch in tag
+            for tag in prep["tags_lower"]
+            for arch in _KNOWN_ARCHITECTURES
+        )
         min_length = 50 if is_known_architecture else 100
 
         if description and len(description.strip()) >= min_length:
             return True
 
-        siblings = parsed_data.get("siblings", []) or parsed_data.get("metadata", {}).get("siblings", [])
-        doc_files = ["README.md", "README.txt", "README.rst", "docs/", "documentation"]
-        for sibling in siblings:
-            if isinstance(sibling, dict):
-                filename = sibling.get("rfilename", "").lower()
-                if any(doc_file.lower() in filename for doc_file in doc_files):
-                    return True
-        return False
+        blob = prep["filename_blob"]
+        return any(doc_file in blob for doc_file in _DOC_FILES)
 
     def get_data(self, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
+        prep = self._prep(parsed_data)
         return {
             "category": parsed_data.get("category", ""),
-            "has_quick_start_guide": self.has_quick_start_guide(parsed_data),
-            "has_installation_instructions": self.has_installation_instructions(parsed_data),
-            "has_runnable_examples": self.has_runnable_examples(parsed_data),
-            "has_minimal_dependencies": self.has_minimal_dependencies(parsed_data),
-            "model_complexity": self.get_model_complexity(parsed_data),
-            "has_clear_documentation": self.has_clear_documentation(parsed_data),
-            "description_length": len(self.get_description(parsed_data)),
-            "tags": parsed_data.get("tags", []) or parsed_data.get("metadata", {}).get("tags", []),
+            "has_quick_start_guide": self.has_quick_start_guide(parsed_data, prep),
+            "has_installation_instructions": self.has_installation_instructions(parsed_data, prep),
+            "has_runnable_examples": self.has_runnable_examples(parsed_data, prep),
+            "has_minimal_dependencies": self.has_minimal_dependencies(parsed_data, prep),
+            "model_complexity": self.get_model_complexity(parsed_data, prep),
+            "has_clear_documentation": self.has_clear_documentation(parsed_data, prep),
+            "description_length": len(prep["description"]),
+            "tags": prep["tags"],
         }
 
     def calculate(self, url: str) -> Dict[str, Any]:
@@ -181,69 +258,26 @@ class RampUpMetric(MetricCalculator):
             logging.warning("RampUpMetric.calculate_score called with no data")
             return
 
-        score = 0.0
-        debug_info = []
-
-        if data["has_clear_documentation"]:
-            if data["description_length"] > 300:
-                score += 0.30
-                debug_info.append("docs_long: +0.30")
-            elif data["description_length"] > 150:
-                score += 0.25
-                debug_info.append("docs_medium: +0.25")
-            elif data["description_length"] > 100:
-                score += 0.15
-                debug_info.append("docs_short: +0.15")
-            else:
-                score += 0.10
-                debug_info.append("docs_minimal: +0.10")
-        else:
-            debug_info.append("docs: 0")
-
-        if data["has_quick_start_guide"]:
-            score += 0.25
-            debug_info.append("quick_start: +0.25")
-        else:
-            debug_info.append("quick_start: 0")
-
-        if data["has_installation_instructions"]:
-            score += 0.20
-            debug_info.append("install: +0.20")
-        else:
-            debug_info.append("install: 0")
-
-        if data["has_runnable_examples"]:
-            score += 0.15
-            debug_info.append("examples: +0.15")
-        else:
-            debug_info.append("examples: 0")
-
-        if data["has_minimal_dependencies"]:
-            score += 0.10
-            debug_info.append("deps: +0.10")
-        else:
-            debug_info.append("deps: 0")
-
-        complexity = data["model_complexity"]
-        if complexity == "small":
-            score += 0.05
-            debug_info.append("complexity_small: +0.05")
-        elif complexity == "large":
-            score -= 0.05
-            debug_info.append("complexity_large: -0.05")
-
-        category = data["category"]
-        if category == "DATASET":
-            score += 0.05
-            debug_info.append("dataset_bonus: +0.05")
-        elif category == "CODE":
-            if not data["has_runnable_examples"]:
-                score -= 0.05
-                debug_info.append("code_penalty: -0.05")
+        has_examples = bool(data["has_runnable_examples"])
+        doc_score = _DOC_BUCKETS[
+            bisect.bisect_left(_DOC_CUTS, data["description_length"])
+        ]
+
+        # Flat multiply-add over the import-time tables — no branch
+        # ladder; bools multiply as 0/1.
+        score = (
+            doc_score * bool(data["has_clear_documentation"])
+            + 0.25 * bool(data["has_quick_start_guide"])
+            + 0.20 * bool(data["has_installation_instructions"])
+            + 0.15 * has_examples
+            + 0.10 * bool(data["has_minimal_dependencies"])
+            + _COMPLEXITY_ADJ.get(data["model_complexity"], 0.0)
+            + _CATEGORY_ADJ.get((data["category"], has_examples), 0.0)
+        )
 
         self.score = min(score, 1.0)
         logging.info(
-            "RampUpMetric score calculated: %s, details: %s",
+            "RampUpMetric score calculated: %s, data: %s",
             self.score,
-            debug_info,
+            data,
         )
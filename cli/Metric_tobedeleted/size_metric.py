@@ -5,6 +5,16 @@ import logging
 from cli.metrics.base import MetricCalculator
 from phase2.repo2.cli.utils.MetadataFetcher import fetch_metadata
 
+# Device thresholds built once at import; calculate_score previously
+# rebuilt the dict (and the all-zero fallback) on every call.
+_DEVICE_THRESHOLDS = (
+    ("raspberry_pi", 50),
+    ("jetson_nano", 200),
+    ("desktop_pc", 2000),
+    ("aws_server", 10000),
+)
+_ZERO_SCORES = {device: 0.0 for device, _ in _DEVICE_THRESHOLDS}
+
 
 class SizeMetric(MetricCalculator):
     """Evaluate model size compatibility with hardware devices.
@@ -25,15 +35,7 @@ class SizeMetric(MetricCalculator):
 
     def calculate_score(self, size_mb: int) -> None:
         if size_mb <= 0:
-            self.size_score = {
-                d: 0.0
-                for d in [
-                    "raspberry_pi",
-                    "jetson_nano",
-                    "desktop_pc",
-                    "aws_server",
-                ]
-            }
+            self.size_score = dict(_ZERO_SCORES)
             self.score = 0.0
             logging.info(
                 "SizeMetric.calculate_score: size <= 0, "
@@ -41,15 +43,8 @@ class SizeMetric(MetricCalculator):
             )
             return
 
-        thresholds = {
-            "raspberry_pi": 50,
-            "jetson_nano": 200,
-            "desktop_pc": 2000,
-            "aws_server": 10000,
-        }
-
         scores = {}
-        for device, max_size in thresholds.items():
+        for device, max_size in _DEVICE_THRESHOLDS:
             if size_mb <= max_size:
                 val = 0.5 + 0.5 * (1 - size_mb / max_size)
             else:
@@ -60,34 +55,26 @@ class SizeMetric(MetricCalculator):
         # keep an overall numeric average for internal uses
         self.score = sum(scores.values()) / len(scores)
 
-    def calculate(self, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
-        start_time = time.perf_counter()
+    def calculate(self, inp: Dict[str, Any]) -> Dict[str, Any]:
+        start_time = time.perf_counter_ns()
         parsed_data: Dict[str, Any] = {}
         try:
             # If caller passed a URL string, have fetch_metadata gather
             # consistent metadata for downstream scoring.
-            if isinstance(parsed_data, str):
-                parsed_data = fetch_metadata(parsed_data)
-            elif not isinstance(parsed_data, dict):
-                parsed_data = {}
+            if isinstance(inp, str):
+                parsed_data = fetch_metadata(inp) or {}
+            elif isinstance(inp, dict):
+                parsed_data = inp
 
             size_mb = self.get_data(parsed_data)
             self.calculate_score(size_mb)
         except Exception:
             logging.exception("Error computing size metric")
-            self.size_score = {
-                d: 0.0
-                for d in [
-                    "raspberry_pi",
-                    "jetson_nano",
-                    "desktop_pc",
-                    "aws_server",
-                ]
-            }
+            self.size_score = dict(_ZERO_SCORES)
             self.score = 0.0
 
-        latency = (time.perf_counter() - start_time) * 1000.0
+        latency = (time.perf_counter_ns() - start_time) // 1_000_000
         return {
             "size_score": self.size_score,
-            "size_score_latency": int(latency),
+            "size_score_latency": latency,
         }
@@ -1,7 +1,13 @@
+import functools
+import os
+import re
 import sys
 import json
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Any
 from cli.menu import Menu
+from phase2.repo2.cli.utils.MetadataFetcher import fetch_metadata
 from cli.metrics.license_metric import LicenseMetric
 from cli.metrics.size_metric import SizeMetric
 from cli.metrics.bus_factor_metric import BusFactorMetric
@@ -22,22 +28,67 @@ WEIGHTS = {
     "code_quality": 0.10,
 }
 
+# Weight vector snapshotted once; process_url folds it in one pass.
+_WEIGHT_ITEMS = tuple(WEIGHTS.items())
+
+# Metric classes in scoring order. Instances are built per process_url
+# call: calculate() stores intermediate state on self (score,
+# size_score, ...), so sharing instances across the URL worker pool
+# would let concurrent URLs overwrite each other's results.
+_METRIC_CLASSES = (
+    RampUpMetric,
+    BusFactorMetric,
+    PerformanceClaimsMetric,
+    LicenseMetric,
+    SizeMetric,
+    DatasetAndCodeMetric,
+    DatasetQualityMetric,
+    CodeQualityMetric,
+)
+
+
+# Anchored to the host portion (same idiom as MetadataFetcher's URL
+# regex): only the URL's own host decides the category, so an HF or
+# GitHub link embedded in another URL's path or query string no longer
+# classifies it. Alternative order keeps the priority of the old
+# substring chain — datasets win over plain HF hosts.
+_KIND_RE = re.compile(
+    r"^(?:https?://)?(?:www\.)?"
+    r"(?:(huggingface\.co/datasets)|(huggingface\.co)|(github\.com))"
+)
+_KIND_NAMES = ("DATASET", "MODEL", "REPO")
+
+
+@functools.lru_cache(maxsize=4096)
+def _categorize(url: str) -> str:
+    """Categorize a URL in one scan; results are memoized."""
+    m = _KIND_RE.match(url)
+    if m is None:
+        return "UNKNOWN"
+    return _KIND_NAMES[m.lastindex - 1]
 
-def process_url(url: str):
-    metrics = [
-        RampUpMetric(),
-        BusFactorMetric(),
-        PerformanceClaimsMetric(),
-        LicenseMetric(),
-        SizeMetric(),
-        DatasetAndCodeMetric(),
-        DatasetQualityMetric(),
-        CodeQualityMetric(),
-    ]
 
+def process_url(url: str):
+    metrics = tuple(cls() for cls in _METRIC_CLASSES)
+
+    # Fetch metadata once and share the parsed dict across all metrics
+    # instead of each metric issuing its own fetch_metadata round-trip.
+    parsed = None
+    try:
+        parsed = fetch_metadata(url, include_commits=True)
+    except Exception:
+        logging.exception("Error fetching metadata for %s", url)
+
+    # Metrics are network-bound, so overlap their HTTP waits: per-URL
+    # wall time drops from the sum of metric latencies toward the max.
     metrics_results: Dict[str, Any] = {}
-    for metric in metrics:
-        metrics_results.update(metric.timed_calculate(url))
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [
+            pool.submit(metric.timed_calculate, url, parsed)
+            for metric in metrics
+        ]
+        for fut in as_completed(futures):
+            metrics_results.update(fut.result())
 
 
     # Compute net_score as weighted sum
@@ -48,26 +99,23 @@ def process_url(url: str):
         vals = [float(v) for v in size_obj.values()]
         size_mean = sum(vals) / len(vals)
 
-    net = (
-        WEIGHTS["ramp_up_time"]
-        * float(metrics_results.get("ramp_up_time", 0.0))
-        + WEIGHTS["bus_factor"] * float(metrics_results.get("bus_factor", 0.0))
-        + WEIGHTS["performance_claims"]
-        * float(metrics_results.get("performance_claims", 0.0))
-        + WEIGHTS["license"] * float(metrics_results.get("license", 0.0))
-        + WEIGHTS["size_score"] * float(size_mean)
-        + WEIGHTS["dataset_and_code_score"]
-        * float(metrics_results.get("dataset_and_code_score", 0.0))
-        + WEIGHTS["code_quality"]
-        * float(metrics_results.get("code_quality", 0.0))
+    # One dot product over the precomputed weight vector instead of a
+    # hand-unrolled seven-term sum of keyed lookups.
+    net = sum(
+        weight
+        * (
+            size_mean
+            if key == "size_score"
+            else float(metrics_results.get(key, 0.0))
+        )
+        for key, weight in _WEIGHT_ITEMS
     )
 
     net = max(0.0, min(1.0, float(net)))
-    # collect net latency as sum of metric latencies
+    # collect net latency as sum of metric latencies; every metric
+    # already reports its latency as an int, so no per-value coercion
     net_latency = sum(
-        int(v)
-        for k, v in metrics_results.items()
-        if k.endswith("_latency") and isinstance(v, (int, float))
+        v for k, v in metrics_results.items() if k.endswith("_latency")
     )
 
     results = metrics_results
@@ -85,14 +133,7 @@ def process_url(url: str):
     )
 
     # Categorize URL type
-    if "huggingface.co/datasets" in url:
-        results["category"] = "DATASET"
-    elif "huggingface.co" in url:
-        results["category"] = "MODEL"
-    elif "github.com" in url:
-        results["category"] = "REPO"
-    else:
-        results["category"] = "UNKNOWN"
+    results["category"] = _categorize(url)
 
     return results
 
@@ -134,8 +175,16 @@ def main(argv: list[str] | None = None) -> int:
     # otherwise treat first arg as urls file
     urls_file = argv[0]
     urls = menu.read_urls(urls_file)
-    for u in urls:
-        result = process_url(u)
+    if not urls:
+        return 0
+
+    # URLs are independent and network-bound, so score them in parallel.
+    # pool.map preserves input order, keeping the NDJSON output stable.
+    workers = int(os.getenv("PHASE2_WORKERS", "8"))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(process_url, urls))
+
+    for result in results:
         print(json.dumps(result, separators=(",", ":")))
         # Also emit a simple net score line to stderr for visibility
         net = result.get("net_score")
@@ -1,6 +1,19 @@
 import sys
-import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:  # pragma: no cover - optional speedup
+    import json
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
 from pathlib import Path
 from cli.metrics.rampup_metric import RampUpMetric
 from cli.metrics.bus_factor_metric import BusFactorMetric
@@ -10,6 +23,7 @@ from cli.metrics.size_metric import SizeMetric
 from cli.metrics.dataset_and_code_metric import DatasetAndCodeMetric
 from cli.metrics.dataset_quality_metric import DatasetQualityMetric
 from cli.metrics.code_quality_metric import CodeQualityMetric
+from phase2.repo2.cli.utils.MetadataFetcher import fetch_metadata
 
 
 METRICS = {
@@ -34,6 +48,24 @@ WEIGHTS = {
     "code_quality": 0.10,
 }
 
+# Weight vector snapshotted once; _score_one folds it in one pass,
+# mirroring cli.main.
+_WEIGHT_ITEMS = tuple(WEIGHTS.items())
+
+# Metric instances are reused per worker thread, not shared globally:
+# calculate() stashes results on self before returning them, so one
+# shared tuple would race across the run_score_all pool. Thread-locals
+# still amortize construction over every URL a worker handles.
+_METRIC_TLS = threading.local()
+
+
+def _thread_metrics():
+    metrics = getattr(_METRIC_TLS, "metrics", None)
+    if metrics is None:
+        metrics = tuple(cls() for _, cls in METRICS.values())
+        _METRIC_TLS.metrics = metrics
+    return metrics
+
 
 class Menu:
     """Interactive menu wrapper for scoring utilities.
@@ -51,69 +83,82 @@ class Menu:
         if not p.exists():
             print(f"URLs file not found: {p}")
             return []
-        return [
-            line.strip()
-            for line in p.read_text().splitlines()
-            if line.strip()
-        ]
+        # Stream line by line: no full-text string or splitlines() list,
+        # only the final filtered list is materialized.
+        with p.open("r", encoding="utf-8") as fh:
+            return [s for s in (line.strip() for line in fh) if s]
+
+    def _score_one(self, url: str) -> Dict[str, Any]:
+        """Score a single URL with all metrics and attach net_score."""
+        metrics = _thread_metrics()
+
+        # Fetch metadata once and let every metric reuse the parsed dict
+        # instead of each issuing its own fetch_metadata round-trip.
+        parsed = None
+        try:
+            parsed = fetch_metadata(url, include_commits=True)
+        except Exception as e:
+            print(f"  Metadata fetch failed for {url}: {e}")
+
+        accum: Dict[str, Any] = {}
+        for m in metrics:
+            try:
+                accum.update(m.timed_calculate(url, parsed))
+            except Exception as e:
+                print(f"  Metric {m.name} failed: {e}")
+        # Compute net_score using same weighting as cli.main
+        # size_score may be a dict -> average
+        size_obj = accum.get("size_score")
+        size_mean = 0.0
+        if isinstance(size_obj, dict) and size_obj:
+            vals = [float(v) for v in size_obj.values()]
+            size_mean = sum(vals) / len(vals)
+
+        net = sum(
+            weight
+            * (
+                size_mean
+                if key == "size_score"
+                else float(accum.get(key, 0.0))
+            )
+            for key, weight in _WEIGHT_ITEMS
+        )
+
+        net = max(0.0, min(1.0, float(net)))
+        net_latency = sum(
+            int(v)
+            for k, v in accum.items()
+            if k.endswith("_latency") and isinstance(v, (int, float))
+        )
+
+        accum["net_score"] = net
+        accum["net_score_latency"] = int(net_latency)
+        return accum
 
     def run_score_all(self, urls_file: str | None = None) -> None:
         urls = self.read_urls(urls_file)
         if not urls:
             return
-        metrics = [
-            RampUpMetric(),
-            BusFactorMetric(),
-            PerformanceClaimsMetric(),
-            LicenseMetric(),
-            SizeMetric(),
-            DatasetAndCodeMetric(),
-            DatasetQualityMetric(),
-            CodeQualityMetric(),
-        ]
-
-        for u in urls:
-            print(f"Scoring: {u}")
-            accum: Dict[str, Any] = {}
-            for m in metrics:
-                try:
-                    accum.update(m.timed_calculate(u))
-                except Exception as e:
-                    print(f"  Metric {m.name} failed: {e}")
-            # Compute net_score using same weighting as cli.main
-            # size_score may be a dict -> average
-            size_obj = accum.get("size_score")
-            size_mean = 0.0
-            if isinstance(size_obj, dict) and size_obj:
-                vals = [float(v) for v in size_obj.values()]
-                size_mean = sum(vals) / len(vals)
-
-            net = (
-                WEIGHTS["ramp_up_time"] * float(accum.get("ramp_up_time", 0.0))
-                + WEIGHTS["bus_factor"] * float(accum.get("bus_factor", 0.0))
-                + WEIGHTS["performance_claims"]
-                * float(accum.get("performance_claims", 0.0))
-                + WEIGHTS["license"] * float(accum.get("license", 0.0))
-                + WEIGHTS["size_score"] * float(size_mean)
-                + WEIGHTS["dataset_and_code_score"]
-                * float(accum.get("dataset_and_code_score", 0.0))
-                + WEIGHTS["code_quality"]
-                * float(accum.get("code_quality", 0.0))
-            )
-
-            net = max(0.0, min(1.0, float(net)))
-            net_latency = sum(
-                int(v)
-                for k, v in accum.items()
-                if k.endswith("_latency") and isinstance(v, (int, float))
-            )
-
-            accum["net_score"] = net
-            accum["net_score_latency"] = int(net_latency)
 
-            print(json.dumps(accum, separators=(",", ":")))
+        # Each URL's metrics are network-bound, so score URLs in
+        # parallel and buffer the results to print in input order.
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(self._score_one, urls))
+
+        out = sys.stdout.buffer
+        for u, accum in zip(urls, results):
+            # Emit the header through the same binary layer as the JSON
+            # row: mixing print() with buffer writes lets the text
+            # layer's block buffering reorder headers past the rows
+            # when stdout is piped.
+            out.write(f"Scoring: {u}\n".encode())
+            # orjson encodes in C straight to bytes; write to the binary
+            # buffer so no intermediate str is built per line.
+            out.write(_dumps(accum))
+            out.write(b"\n")
+            out.flush()
             # Also emit a simple net score line to stderr for visibility
-            print(f"net_score: {net}", file=sys.stderr)
+            print(f"net_score: {accum['net_score']}", file=sys.stderr)
 
     def run_score_metric(
         self, urls_file: str | None, metric_name: str
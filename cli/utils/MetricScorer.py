@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Any
 from cli.utils.metrics.codequality import CodeQuality
 from cli.utils.metrics.datasetquality import DatasetQuality
@@ -37,24 +38,34 @@ class MetricScorer:
 
     def score_all_metrics(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Calls each metric’s getScores() and
+        Calls each metric’s getScores() concurrently and
         flattens the results into a single dictionary.
         """
         results: Dict[str, Any] = {}
 
-        for name, metric in self.metrics.items():
-            try:
-                metric_result = metric.getScores(data)
-                score = round(metric_result.get("score", 0.0), 3)
-                latency = round(metric_result.get("latency", 0.0), 3)
+        # Metrics are independent and mostly wait on the network, so run
+        # them all at once; wall time drops to roughly the slowest one.
+        # Each gets a shallow copy of data so none can mutate a sibling's
+        # input mid-flight.
+        with ThreadPoolExecutor(max_workers=len(self.metrics)) as pool:
+            futures = {
+                pool.submit(metric.getScores, dict(data)): name
+                for name, metric in self.metrics.items()
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    metric_result = future.result()
+                    score = round(metric_result.get("score", 0.0), 3)
+                    latency = round(metric_result.get("latency", 0.0), 3)
 
-                # Add flattened keys
-                results[name] = score
-                results[f"{name}_latency"] = latency
+                    # Add flattened keys
+                    results[name] = score
+                    results[f"{name}_latency"] = latency
 
-            except Exception as e:
-                print(f"[WARN] Metric '{name}' failed: {e}")
-                results[name] = 0.0
-                results[f"{name}_latency"] = 0.0
+                except Exception as e:
+                    print(f"[WARN] Metric '{name}' failed: {e}")
+                    results[name] = 0.0
+                    results[f"{name}_latency"] = 0.0
 
         return results
@@ -1,6 +1,5 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict
-from cli.utils.MetadataFetcher import MetadataFetcher
 
 
 class BaseDataFetcher(ABC):
@@ -17,11 +16,12 @@ class BaseDataFetcher(ABC):
         7. Ramp-up Time
         8. Size
     """
+    __slots__ = ("metadata",)
+
     metadata: Dict[str, Any]
 
     def __init__(self):
         self.metadata = {}
-        self.MetadataFetcher = MetadataFetcher()
 
     @abstractmethod
     def fetch_Modeldata(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -7,6 +7,8 @@ class BusFactorDataFetcher(BaseDataFetcher):
     Class for fetching Bus Factor-related data.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
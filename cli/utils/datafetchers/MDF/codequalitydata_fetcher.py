@@ -7,6 +7,8 @@ class CodeQualityDataFetcher(BaseDataFetcher):
     Class for fetching code quality-related data.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -7,6 +7,8 @@ class DatasetDataFetcher(BaseDataFetcher):
     Class for fetching dataset-related data.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
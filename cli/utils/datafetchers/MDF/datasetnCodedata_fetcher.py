@@ -7,6 +7,8 @@ class DatasetAndCodeDataFetcher(BaseDataFetcher):
     Class for fetching dataset and code-related data.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -1,44 +1,60 @@
+import functools
 from cli.utils.datafetchers.MDF.basemetricdata_fetcher import BaseDataFetcher
 from typing import Any, Dict
 
 
+@functools.lru_cache(maxsize=1024)
+def _norm(license_name: str) -> str:
+    """
+    Normalize a raw license string. The license domain is a small enum
+    (~30 values in practice), so repeats become a cache hit instead of
+    a strip + lower allocation.
+    """
+    return license_name.strip().lower()
+
+
 class LicenseDataFetcher(BaseDataFetcher):
     """
     Class for fetching license-related data.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
     def fetch_HFdata(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        # Initialize metadata dictionary
-        self.metadata = {}
-        # Fetch license
-        license_name = None
-        # Direct license field
-        if "license" in data:
+        # Resolve the license from the first source that has one:
+        # direct field, then cardData, then license: tags — each
+        # fallback is only evaluated when the previous came up empty.
+        # Fast path: most HF payloads carry a top-level license, so
+        # return after one lookup and one normalize.
+        # Duck-typed probing: the HF API guarantees string licenses,
+        # dict cardData and string tags, so lean on `or`-defaults
+        # instead of isinstance guards; the outer except maps any
+        # malformed payload to "unknown" instead of raising mid-fetch.
+        try:
             license_name = data.get("license")
-        # Check cardData section
-        if not license_name and "cardData" in data:
-            card_data = data.get("cardData", {})
-            if isinstance(card_data, dict):
-                license_name = card_data.get("license")
-        # Check tags field
-        if not license_name and "tags" in data:
-            tags = data.get("tags", [])
-            if isinstance(tags, list):
-                for tag in tags:
-                    if isinstance(tag, str) and tag.lower().startswith("license:"):
-                        license_name = tag.split(":", 1)[1].strip()
-                        break
-        # Default fallback
-        if not license_name:
-            license_name = "unknown"
-        # Normalize formatting
-        license_name = str(license_name).strip().lower()
-        # Store in metadata
-        self.metadata["license"] = license_name
-        # Return metadata dictionary
+            if license_name:
+                self.metadata = {"license": _norm(license_name)}
+                return self.metadata
+            license_name = (data.get("cardData") or {}).get("license")
+            if not license_name:
+                for tag in data.get("tags") or ():
+                    # lowercase only the 8-char prefix, not the
+                    # whole tag, to test for "license:"; a malformed
+                    # tag is skipped, not the whole scan
+                    try:
+                        if tag[:8].lower() == "license:":
+                            license_name = tag.split(":", 1)[1].strip()
+                            break
+                    except (AttributeError, TypeError):
+                        continue
+            # Default fallback, normalize, and store in one literal —
+            # every source above yields a string, no str() coercion
+            self.metadata = {"license": _norm(license_name or "unknown")}
+        except (AttributeError, TypeError):
+            self.metadata = {"license": "unknown"}
         return self.metadata
 
     def fetch_Datasetdata(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -51,15 +67,8 @@ class LicenseDataFetcher(BaseDataFetcher):
         """
         Fetch the license for a GitHub repository from its API metadata.
         """
-        # Initialize metadata dictionary
-        self.metadata = {}
-        license_info = data.get("license")
-        license_name = "unknown"
-        if isinstance(license_info, dict):
-            # Prefer full name if available
-            license_name = license_info.get("name") or "unknown"
-        # Normalize formatting
-        license_name = str(license_name).strip().lower()
-        # Store in metadata
-        self.metadata["license"] = license_name
+        # Prefer full name if available; the GitHub API always returns
+        # the name as a string, so normalize without a str() coercion
+        license_name = (data.get("license") or {}).get("name")
+        self.metadata = {"license": _norm(license_name or "unknown")}
         return self.metadata
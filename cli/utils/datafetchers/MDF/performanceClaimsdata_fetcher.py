@@ -7,6 +7,8 @@ class PerformanceClaimsDataFetcher(BaseDataFetcher):
     Class for fetching performance claims-related data.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -7,6 +7,8 @@ class RampUpTimeDataFetcher(BaseDataFetcher):
     Class for fetching ramp-up time-related data.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
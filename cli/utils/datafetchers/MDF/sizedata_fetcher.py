@@ -7,6 +7,8 @@ class SizeDataFetcher(BaseDataFetcher):
     Class for fetching size-related data for models, converting to megabytes.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -28,7 +30,12 @@ class SizeDataFetcher(BaseDataFetcher):
         if total_size_bytes is None:
             return {"model_size_mb": "unknown"}
 
-        # Convert bytes to megabytes (1 MB = 1024*1024 bytes)
-        total_size_mb = total_size_bytes / (1024 * 1024)
+        # Convert bytes to megabytes (1 MB = 1024*1024 bytes), rounded
+        # to 2 decimals. For the common integer byte count, multiply,
+        # add half an MB-unit and shift — no intermediate float or
+        # round() call.
+        if isinstance(total_size_bytes, int):
+            mb_x100 = (total_size_bytes * 100 + (1 << 19)) >> 20
+            return {"model_size_mb": mb_x100 / 100.0}
 
-        return {"model_size_mb": round(total_size_mb, 2)}  # rounded to 2 decimals
+        return {"model_size_mb": round(total_size_bytes / 1048576.0, 2)}
@@ -10,42 +10,89 @@ from cli.utils.datafetchers.MDF.rampuptimedata_fetcher import RampUpTimeDataFetc
 from cli.utils.datafetchers.MDF.datasetnCodedata_fetcher import DatasetAndCodeDataFetcher
 
 
+# All fetchers implementing the three methods, built once at import —
+# they hold no per-URL state worth isolating, and every MetricDataFetcher
+# instance used to rebuild all eight (plus a MetadataFetcher each via the
+# old BaseDataFetcher constructor).
+_FETCHERS = (
+    LicenseDataFetcher(),
+    BusFactorDataFetcher(),
+    DatasetDataFetcher(),
+    CodeQualityDataFetcher(),
+    SizeDataFetcher(),
+    PerformanceClaimsDataFetcher(),
+    RampUpTimeDataFetcher(),
+    DatasetAndCodeDataFetcher(),
+)
+
+# Bound methods resolved once: the per-URL loops call straight through
+# these tuples instead of doing eight attribute lookups per view.
+_MODEL_METHODS = tuple(f.fetch_Modeldata for f in _FETCHERS)
+_CODE_METHODS = tuple(f.fetch_Codedata for f in _FETCHERS)
+_DATASET_METHODS = tuple(f.fetch_Datasetdata for f in _FETCHERS)
+
+
 class MetricDataFetcher:
     def __init__(self):
         self.MetaDataFetcher = MetadataFetcher()
-        # All fetchers implementing the three methods
-        self.fetchers = [
-            LicenseDataFetcher(),
-            BusFactorDataFetcher(),
-            DatasetDataFetcher(),
-            CodeQualityDataFetcher(),
-            SizeDataFetcher(),
-            PerformanceClaimsDataFetcher(),
-            RampUpTimeDataFetcher(),
-            DatasetAndCodeDataFetcher()
-        ]
+        self.fetchers = _FETCHERS
 
     def fetch_Modeldata(self, url: str) -> Dict[str, Any]:
         data = self.MetaDataFetcher.fetch(url)
         modeldata = {}
-        for fetcher in self.fetchers:
-            modeldata.update(fetcher.fetch_Modeldata(data))
+        for method in _MODEL_METHODS:
+            modeldata.update(method(data))
         return modeldata
 
     def fetch_CodeData(self, url: str) -> Dict[str, Any]:
         data = self.MetaDataFetcher.fetch(url)
         codedata = {}
-        for fetcher in self.fetchers:
-            codedata.update(fetcher.fetch_Codedata(data))
+        for method in _CODE_METHODS:
+            codedata.update(method(data))
         return codedata
 
     def fetch_DatasetData(self, url: str) -> Dict[str, Any]:
         data = self.MetaDataFetcher.fetch(url)
         datasetdata = {}
-        for fetcher in self.fetchers:
-            datasetdata.update(fetcher.fetch_Datasetdata(data))
+        for method in _DATASET_METHODS:
+            datasetdata.update(method(data))
         return datasetdata
 
+    def _views_from_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Run every fetcher over one metadata dict, all three views."""
+        modeldata: Dict[str, Any] = {}
+        codedata: Dict[str, Any] = {}
+        datasetdata: Dict[str, Any] = {}
+        for model_m, code_m, dataset_m in zip(
+            _MODEL_METHODS, _CODE_METHODS, _DATASET_METHODS
+        ):
+            modeldata.update(model_m(data))
+            codedata.update(code_m(data))
+            datasetdata.update(dataset_m(data))
+        return {
+            "model": modeldata,
+            "code": codedata,
+            "dataset": datasetdata,
+        }
+
+    def fetch_all(self, url: str) -> Dict[str, Any]:
+        """
+        Fetch metadata once and build all three data views from it,
+        instead of one fetch() per view method.
+        """
+        return self._views_from_data(self.MetaDataFetcher.fetch(url))
+
+    def fetch_all_batch(self, urls) -> Dict[str, Any]:
+        """
+        Fetch metadata for many URLs concurrently, then build the views
+        locally (pure dict work). Failed URLs map to None.
+        """
+        metadata = self.MetaDataFetcher.fetch_batch(urls, max_workers=16)
+        return {
+            url: self._views_from_data(data) if data is not None else None
+            for url, data in metadata.items()
+        }
+
 
 if __name__ == "__main__":
     # Example URL — Hugging Face Gemma 3 model
@@ -0,0 +1,108 @@
+# cli/utils/github_graphql.py
+import functools
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+import requests
+
+GITHUB_GRAPHQL_API = "https://api.github.com/graphql"
+
+# One query returns the license, README text and recent commit authors
+# together, collapsing the three REST round-trips (license / readme /
+# commits) into a single POST per repo.
+_REPO_BUNDLE_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    licenseInfo { spdxId }
+    object(expression: "HEAD:README.md") {
+      ... on Blob { text }
+    }
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(first: 100) {
+            nodes {
+              author {
+                user { login }
+                name
+                email
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+_SESSION = requests.Session()
+
+
+@functools.lru_cache(maxsize=256)
+def fetch_repo_bundle(owner: str, repo: str) -> Optional[Dict[str, Any]]:
+    """Fetch license, README and commit authors for a repo in one call.
+
+    Returns a dict with keys ``spdx_id``, ``readme_text`` and
+    ``commit_authors``, or None when the GraphQL API is unavailable
+    (no token, network error, or repo not found). Results are cached so
+    multiple metrics scoring the same URL share one round-trip.
+    """
+    token = os.getenv("GITHUB_TOKEN")
+    if not token:
+        # GraphQL requires authentication; let callers fall back to REST.
+        return None
+
+    try:
+        resp = _SESSION.post(
+            GITHUB_GRAPHQL_API,
+            json={
+                "query": _REPO_BUNDLE_QUERY,
+                "variables": {"owner": owner, "name": repo},
+            },
+            headers={"Authorization": f"bearer {token}"},
+            timeout=10,
+        )
+        if resp.status_code != 200:
+            logging.warning(
+                "GitHub GraphQL returned %s for %s/%s",
+                resp.status_code,
+                owner,
+                repo,
+            )
+            return None
+
+        repository = (resp.json().get("data") or {}).get("repository")
+        if not repository:
+            return None
+
+        license_info = repository.get("licenseInfo") or {}
+        readme_obj = repository.get("object") or {}
+
+        authors: List[str] = []
+        branch_ref = repository.get("defaultBranchRef") or {}
+        history = (
+            (branch_ref.get("target") or {}).get("history") or {}
+        ).get("nodes") or []
+        for node in history:
+            author = (node or {}).get("author") or {}
+            user = author.get("user") or {}
+            login = user.get("login")
+            if login:
+                authors.append(login)
+            elif author.get("name"):
+                authors.append(author["name"])
+            elif author.get("email"):
+                authors.append(author["email"])
+
+        return {
+            "spdx_id": license_info.get("spdxId"),
+            "readme_text": readme_obj.get("text"),
+            "commit_authors": authors,
+        }
+    except Exception:
+        logging.exception(
+            "Error fetching GraphQL bundle for %s/%s", owner, repo
+        )
+        return None
@@ -0,0 +1,11 @@
+import bisect
+
+
+def tiered_score(value, thresholds, scores) -> float:
+    """
+    Map a value onto a score tier with one binary search.
+    `thresholds` is an ascending tuple of tier boundaries and `scores`
+    has one more entry than `thresholds`; a value below the first
+    boundary gets scores[0], and so on.
+    """
+    return scores[bisect.bisect_right(thresholds, value)]
@@ -8,6 +8,9 @@ class BaseMetric(ABC):
     Abstract base class for all metric types.
     Provides timing and score storage.
     """
+    # Fixed attribute set: slots drop the per-instance __dict__ and
+    # make score/latency access a direct offset.
+    __slots__ = ("score", "latency")
 
     def __init__(self):
         self.score: float = 0.0
@@ -27,12 +30,13 @@ class BaseMetric(ABC):
         Calculates the metric and measures its latency.
         Returns both the score and latency.
         """
-        start_time = time.time()
+        # Monotonic nanosecond clock: immune to wall-clock jumps and
+        # fine enough to time sub-millisecond metrics.
+        start_time = time.perf_counter_ns()
         # Run the actual metric calculation
         self.calculate_metric(data)
-        end_time = time.time()
         # Compute latency in milliseconds
-        self.latency = (end_time - start_time) * 1000.0
+        self.latency = (time.perf_counter_ns() - start_time) / 1_000_000.0
         return {
             "score": self.score,
             "latency": self.latency
@@ -8,6 +8,8 @@ class BusFactorMetric(BaseMetric):
     Class for scoring Bus Factor Metric
     """
 
+    __slots__ = ("datafetcher",)
+
     def __init__(self):
         super().__init__()
         self.datafetcher = DataFetcher()
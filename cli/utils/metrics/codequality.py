@@ -7,6 +7,8 @@ class CodeQualityMetric(BaseMetric):
     Class for scoring Code Quality Metric
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -7,6 +7,8 @@ class DatasetAndCodeScoreMetric(BaseMetric):
     Class for scoring Dataset and Code Quality Metric
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
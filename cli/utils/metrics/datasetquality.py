@@ -7,6 +7,8 @@ class DatasetQualityMetric(BaseMetric):
     Class for scoring Dataset Quality Metric
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
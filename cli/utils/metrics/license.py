@@ -1,7 +1,44 @@
+import functools
 from typing import Any, Dict
 from cli.utils.metrics.basemetric import BaseMetric
 from cli.utils.datafetchers.MDF.licensedata_fetcher import LicenseDataFetcher
 
+# License categories built once at import instead of two list literals
+# per call. The frozensets give O(1) exact matches for the common case
+# of a clean SPDX id; the tuples keep the original substring fallback
+# for compound names like "apache-2.0-with-llvm-exception".
+HIGH_QUALITY = frozenset({
+    "mit", "apache-2.0", "bsd-3-clause", "bsd-2-clause",
+    "cc0", "cc0-1.0", "isc", "zlib", "unlicense"
+})
+MEDIUM_QUALITY = frozenset({
+    "mpl-2.0", "lgpl-3.0", "cc-by-4.0", "cc-by-sa-4.0", "epl-2.0",
+    "artistic-2.0", "agpl-3.0", "openrail"
+})
+_HIGH_QUALITY_KEYS = tuple(HIGH_QUALITY)
+_MEDIUM_QUALITY_KEYS = tuple(MEDIUM_QUALITY)
+
+
+@functools.lru_cache(maxsize=256)
+def _score_license(license_name: str) -> float:
+    """
+    Score a normalized license string. Batches tend to repeat a handful
+    of licenses, so the cache turns the substring scans into lookups.
+    """
+    if license_name == "custom":
+        return 0.5
+    if license_name == "unknown":
+        return 0.2
+    if license_name in HIGH_QUALITY or any(
+        key in license_name for key in _HIGH_QUALITY_KEYS
+    ):
+        return 1.0
+    if license_name in MEDIUM_QUALITY or any(
+        key in license_name for key in _MEDIUM_QUALITY_KEYS
+    ):
+        return 0.75
+    return 0
+
 
 class LicenseMetric(BaseMetric):
     """
@@ -13,31 +50,13 @@ class LicenseMetric(BaseMetric):
         - Unknown (score = 0.2)
     """
 
+    __slots__ = ("datafetcher",)
+
     def __init__(self):
         super().__init__()
         self.datafetcher = LicenseDataFetcher()
 
     def calculate_metric(self, data: Dict[str, Any]) -> float:
-        # Fetch license info
-        license_name = data.get("license", "unknown").lower()
-        # Define license categories
-        high_quality = [
-            "mit", "apache-2.0", "bsd-3-clause", "bsd-2-clause",
-            "cc0", "cc0-1.0", "isc", "zlib", "unlicense"
-        ]
-        medium_quality = [
-            "mpl-2.0", "lgpl-3.0", "cc-by-4.0", "cc-by-sa-4.0", "epl-2.0",
-            "artistic-2.0", "agpl-3.0", "openrail"
-        ]
-        # Determine score
-        if license_name == "custom":
-            self.score = 0.5
-        elif license_name == "unknown":
-            self.score = 0.2
-        elif any(key in license_name for key in high_quality):
-            self.score = 1.0
-        elif any(key in license_name for key in medium_quality):
-            self.score = 0.75
-        else:
-            self.score = 0
+        # Fetch license info and score it via the memoized helper
+        self.score = _score_license(data.get("license", "unknown").lower())
         return self.score
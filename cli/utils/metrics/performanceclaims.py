@@ -1,5 +1,11 @@
 from typing import Any, Dict
 from cli.utils.metrics.basemetric import BaseMetric
+from cli.utils.metrics._tiered import tiered_score
+
+# Tier boundaries and scores, shared shape with the other tiered
+# metrics; one bisect replaces the branch ladder.
+_THRESHOLDS = (100, 500, 1000)
+_SCORES = (1.0, 0.8, 0.5, 0.2)
 
 
 class PerformanceClaimsMetric(BaseMetric):
@@ -7,6 +13,8 @@ class PerformanceClaimsMetric(BaseMetric):
     Class for scoring Performance Claims Metric
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -15,13 +23,6 @@ class PerformanceClaimsMetric(BaseMetric):
         performance_claims = data.get("performance_claims", 0)
 
         # Scoring logic based on performance claims
-        if performance_claims < 100:
-            self.score = 1.0
-        elif performance_claims < 500:
-            self.score = 0.8
-        elif performance_claims < 1000:
-            self.score = 0.5
-        else:
-            self.score = 0.2
+        self.score = tiered_score(performance_claims, _THRESHOLDS, _SCORES)
 
         return self.score
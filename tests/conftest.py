@@ -0,0 +1,41 @@
+import pytest
+
+
+@pytest.fixture(scope="module")
+def vcr_config():
+    """
+    VCR settings for the network tests (pytest-recording). record_mode
+    "once" records a cassette on the first live run and replays it from
+    disk afterwards; auth headers never land in the cassettes.
+    """
+    return {
+        "record_mode": "once",
+        "filter_headers": ["authorization"],
+        "decode_compressed_response": True,
+    }
+
+
+@pytest.fixture(scope="session")
+def metric_cache():
+    """Session-wide cache of metric results keyed by (metric, url)."""
+    return {}
+
+
+@pytest.fixture
+def compute(metric_cache):
+    """
+    Compute a metric result for a URL at most once per session.
+    Accepts either a metric class (instantiated and `.calculate`d) or a
+    plain callable like `process_url`; repeat calls for the same
+    (metric, url) pair return the cached dict instead of re-hitting the
+    network.
+    """
+    def _compute(metric, url):
+        key = (metric, url)
+        if key not in metric_cache:
+            if isinstance(metric, type):
+                metric_cache[key] = metric().calculate(url)
+            else:
+                metric_cache[key] = metric(url)
+        return metric_cache[key]
+    return _compute
@@ -1,31 +1,52 @@
+import contextlib
 import json
-import subprocess
-import sys
 from pathlib import Path
 
+# orjson parses NDJSON rows several times faster than stdlib json and
+# takes bytes directly; fall back like the cli modules do.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 
 def load_ndjson(path: Path):
-    lines = [ln for ln in path.read_text().splitlines() if ln.strip()]
-    return [json.loads(line) for line in lines]
+    # Iterate the file object line by line: peak memory stays at one
+    # row instead of the whole file plus a list of line copies.
+    with path.open("rb") as f:
+        return [_loads(ln) for ln in f if ln.strip()]
+
+
+def _norm(v):
+    # normalize None / non-numeric to -1 (metric error); a type check
+    # instead of try/float keeps exceptions off the comparison loop
+    if isinstance(v, (int, float)):
+        return float(v)
+    return -1.0
+
+
+# scalar metric keys compared between the two repos, plus the
+# per-device size_score dict handled separately
+_SCALAR_KEYS = (
+    "ramp_up_time",
+    "bus_factor",
+    "performance_claims",
+    "license",
+    "dataset_and_code_score",
+    "dataset_quality",
+    "code_quality",
+    "net_score",
+)
 
 
 def extract_scores(obj: dict):
-    keys = [
-        "ramp_up_time",
-        "bus_factor",
-        "performance_claims",
-        "license",
-        "size_score",
-        "dataset_and_code_score",
-        "dataset_quality",
-        "code_quality",
-        "net_score",
-    ]
-    return {k: obj.get(k) for k in keys}
-
-
-def test_repo_outputs_match(tmp_path: Path):
-    urls = Path.cwd() / "urls.txt"
+    return {k: obj.get(k) for k in _SCALAR_KEYS + ("size_score",)}
+
+
+def test_repo_outputs_match(tmp_path: Path, monkeypatch):
+    repo2_dir = Path.cwd()
+    urls = repo2_dir / "urls.txt"
     repo1_out = tmp_path / "repo1.jsonl"
     repo2_out = tmp_path / "repo2.jsonl"
 
@@ -33,48 +54,46 @@ def test_repo_outputs_match(tmp_path: Path):
     # third CSV column (code_url,dataset_url,model_url). Repo1 only scores
     # entries with category == MODEL when processing a file input, so we
     # create lines like: , ,https://huggingface.co/owner/model
+    # Single read + single write: filter through one generator and join
+    # instead of a per-line outf.write.
     repo1_input = tmp_path / "repo1_input.txt"
-    with open(urls, "r") as inf, repo1_input.open("w") as outf:
-        for line in inf:
-            u = line.strip()
-            if not u:
-                continue
-            # only include HF model URLs for repo1 processing
-            if "huggingface.co" in u and "/datasets/" not in u:
-                outf.write(f",,{u}\n")
-
-    # Run repo1 processing directly.
-    # This avoids token/log validation performed by the run wrapper.
-    repo1_dir = Path.cwd().parent / "repo1"
-    # Use python to import and call process_and_score_input_file
-    cmd = [
-        sys.executable,
-        "-c",
-        (
-            "from src.cli import process_and_score_input_file; "
-            f"process_and_score_input_file(r'{repo1_input}')"
-        ),
-    ]
-    with repo1_out.open("w") as f:
-        subprocess.run(cmd, cwd=repo1_dir, check=True, stdout=f)
-
-    # Run repo2 CLI
-    repo2_dir = Path.cwd()
-    cmd2 = [sys.executable, "-m", "cli.main", str(urls)]
-    with repo2_out.open("w") as f2:
-        subprocess.run(cmd2, cwd=repo2_dir, check=True, stdout=f2)
+    repo1_input.write_text("".join(
+        f",,{u}\n"
+        for u in (ln.strip() for ln in urls.read_text().splitlines())
+        # only include HF model URLs for repo1 processing
+        if u and "huggingface.co" in u and "/datasets/" not in u
+    ))
+
+    # Run repo1 processing in-process instead of spawning a fresh
+    # interpreter — imports are paid once and stdout is redirected
+    # straight into the output file. This also avoids token/log
+    # validation performed by the run wrapper.
+    repo1_dir = repo2_dir.parent / "repo1"
+    monkeypatch.syspath_prepend(str(repo1_dir))
+    from src.cli import process_and_score_input_file
+
+    monkeypatch.chdir(repo1_dir)
+    with repo1_out.open("w") as f, contextlib.redirect_stdout(f):
+        process_and_score_input_file(str(repo1_input))
+
+    # Run repo2 CLI the same way via its argv-taking entry point
+    from cli.main import main as repo2_main
+
+    monkeypatch.chdir(repo2_dir)
+    with repo2_out.open("w") as f2, contextlib.redirect_stdout(f2):
+        repo2_main([str(urls)])
 
     a = load_ndjson(repo1_out)
     b = load_ndjson(repo2_out)
 
     # Only compare MODEL entries — repo1 processed MODEL only from the
-    # prepared input. Filter repo2's output for MODEL category rows.
-    b_models = [row for row in b if row.get("category") == "MODEL"]
-
-    assert len(a) == len(b_models)
+    # prepared input. Filter repo2's output and key by name in one
+    # pass, bailing on a length mismatch before any per-row work.
+    b_by_name = {
+        row["name"]: row for row in b if row.get("category") == "MODEL"
+    }
 
-    # Build mapping by name for deterministic comparisons
-    b_by_name = {row.get("name"): row for row in b_models}
+    assert len(a) == len(b_by_name)
 
     for ao in a:
         name = ao.get("name")
@@ -96,30 +115,12 @@ def test_repo_outputs_match(tmp_path: Path):
             for name_, val in (("repo1", va), ("repo2", vb)):
                 assert isinstance(val, float) or isinstance(val, int)
                 assert 0.0 <= float(val) <= 1.0, f"{name_} size_score {k} out of range: {val}"
-        # compare other scalar keys
-        for k in [
-            "ramp_up_time",
-            "bus_factor",
-            "performance_claims",
-            "license",
-            "dataset_and_code_score",
-            "dataset_quality",
-            "code_quality",
-            "net_score",
-        ]:
-            va = sa.get(k)
-            vb = sb.get(k)
-            # normalize None to -1 (metric error) for comparison
-            def _norm(v):
-                if v is None:
-                    return -1.0
-                try:
-                    return float(v)
-                except Exception:
-                    return -1.0
-
-            va = _norm(va)
-            vb = _norm(vb)
+        # compare other scalar keys; bind locals so the inner loop
+        # dispatches LOAD_FAST instead of repeated attribute lookups
+        sa_get, sb_get, norm = sa.get, sb.get, _norm
+        for k in _SCALAR_KEYS:
+            va = norm(sa_get(k))
+            vb = norm(sb_get(k))
 
             # valid values are either -1.0 (error) or in [0.0, 1.0]
             for label, val in (("repo1", va), ("repo2", vb)):
@@ -1,23 +1,27 @@
 import pytest
 from cli.metrics.license_metric import LicenseMetric
 
-def test_license_metric_github_repo():
-    metric = LicenseMetric()
-    result = metric.calculate("https://github.com/psf/requests")
-    assert "license_score" in result
-    assert 0.0 <= float(result["license_score"]) <= 1.0
+# Live HTTP tests: keep them on one xdist worker to avoid rate-limit
+# collisions when the suite runs with --dist=loadgroup.
+pytestmark = [
+    pytest.mark.network,
+    pytest.mark.xdist_group("net"),
+    # replay from tests/cassettes once recorded (see vcr_config)
+    pytest.mark.vcr,
+]
 
-def test_license_metric_non_github():
-    metric = LicenseMetric()
-    result = metric.calculate("https://huggingface.co/some-model")
-    # Non-GitHub URLs should return a license_score of 0.0
-    assert "license_score" in result
-    assert float(result["license_score"]) == 0.0
 
-def test_license_metric_invalid_repo():
-    metric = LicenseMetric()
-    result = metric.calculate("https://github.com/fake/fake")
+@pytest.mark.parametrize("url,expect_exact_zero", [
+    ("https://github.com/psf/requests", False),
+    # Non-GitHub URLs should return a license_score of 0.0
+    ("https://huggingface.co/some-model", True),
+    ("https://github.com/fake/fake", False),
+])
+def test_license_metric(compute, url, expect_exact_zero):
+    result = compute(LicenseMetric, url)
     assert "license_score" in result
-    assert 0.0 <= float(result["license_score"]) <= 1.0
-
-
+    score = float(result["license_score"])
+    if expect_exact_zero:
+        assert score == 0.0
+    else:
+        assert 0.0 <= score <= 1.0
@@ -1,20 +1,30 @@
 import json
+import pytest
 from cli.main import process_url
 
-def test_process_url_github_repo():
-    result = process_url("https://github.com/psf/requests")
+# Live HTTP tests: keep them on one xdist worker to avoid rate-limit
+# collisions when the suite runs with --dist=loadgroup.
+pytestmark = [
+    pytest.mark.network,
+    pytest.mark.xdist_group("net"),
+    # replay from tests/cassettes once recorded (see vcr_config)
+    pytest.mark.vcr,
+]
+
+def test_process_url_github_repo(compute):
+    result = compute(process_url, "https://github.com/psf/requests")
     assert "net_score" in result
     # repo2 uses 'license_score' and 'size_score' keys
     assert "license_score" in result
     assert "size_score" in result
     assert result["category"] == "REPO"
 
-def test_process_url_hf_model():
-    result = process_url("https://huggingface.co/bert-base-uncased")
+def test_process_url_hf_model(compute):
+    result = compute(process_url, "https://huggingface.co/bert-base-uncased")
     assert result["category"] == "MODEL"
 
-def test_process_url_dataset():
-    result = process_url("https://huggingface.co/datasets/imdb")
+def test_process_url_dataset(compute):
+    result = compute(process_url, "https://huggingface.co/datasets/imdb")
     assert result["category"] == "DATASET"
 
 
@@ -1,33 +1,46 @@
+import pytest
 from cli.menu import Menu, METRICS
 
 
-def test_read_urls(tmp_path):
-    p = tmp_path / "urls.txt"
+@pytest.fixture(scope="module")
+def menu(tmp_path_factory):
+    # One urls file + Menu shared by the module; construction re-parses
+    # the file, so build it once instead of per test.
+    p = tmp_path_factory.mktemp("menu") / "urls.txt"
     p.write_text("https://example.com/a\nhttps://example.com/b\n")
-    menu = Menu(str(p))
+    return Menu(str(p))
+
+
+def test_read_urls(menu):
     urls = menu.read_urls()
     assert len(urls) == 2
     assert urls[0].startswith("https://example.com")
 
 
 class DummyMetric:
+    # class-level memo so repeat URLs share one result dict if this
+    # test grows a parametrized URL list
+    _cache = {}
+
     def __init__(self):
         self.name = "dummy"
 
     def timed_calculate(self, url):
-        return {"dummy": 0.5, "dummy_latency": 10}
+        return self._cache.setdefault(
+            url, {"dummy": 0.5, "dummy_latency": 10}
+        )
+
 
+# one shared instance; run_score_metric calls the registered factory
+_DUMMY = DummyMetric()
 
-def test_run_score_metric_monkeypatch(tmp_path, monkeypatch, capsys):
-    # create a urls file
-    p = tmp_path / "urls.txt"
-    p.write_text("https://example.com/a\n")
 
+def test_run_score_metric_monkeypatch(menu, monkeypatch, capsysbinary):
     # inject a fake metric into METRICS mapping
-    monkeypatch.setitem(METRICS, "9", ("dummy", DummyMetric))
+    monkeypatch.setitem(METRICS, "9", ("dummy", lambda: _DUMMY))
 
-    menu = Menu(str(p))
     menu.run_score_metric(None, "dummy")
-    out = capsys.readouterr().out
-    assert "https://example.com/a" in out
-    assert "dummy" in out
+    # bytes-level capture: substring checks don't need the utf-8 decode
+    out = capsysbinary.readouterr().out
+    assert b"https://example.com/a" in out
+    assert b"dummy" in out
@@ -1,50 +1,32 @@
+import pytest
 from cli.metrics.size_metric import SizeMetric
 
-def test_size_metric_github_repo():
-    metric = SizeMetric()
-    result = metric.calculate("https://github.com/psf/requests")
-    assert "size_score" in result
-    ss = result["size_score"]
-    assert isinstance(ss, dict)
-    for v in ss.values():
-        assert 0.0 <= float(v) <= 1.0
+# Live HTTP tests: keep them on one xdist worker to avoid rate-limit
+# collisions when the suite runs with --dist=loadgroup.
+pytestmark = [
+    pytest.mark.network,
+    pytest.mark.xdist_group("net"),
+    # replay from tests/cassettes once recorded (see vcr_config)
+    pytest.mark.vcr,
+]
 
-def test_size_metric_hf_model():
-    metric = SizeMetric()
-    result = metric.calculate("https://huggingface.co/bert-base-uncased")
-    assert "size_score" in result
-    ss = result["size_score"]
-    assert isinstance(ss, dict)
-    for v in ss.values():
-        assert 0.0 <= float(v) <= 1.0
 
-def test_size_metric_hf_dataset():
-    metric = SizeMetric()
-    result = metric.calculate("https://huggingface.co/datasets/imdb")
+@pytest.mark.parametrize("url,expect_zero", [
+    ("https://github.com/psf/requests", False),
+    ("https://huggingface.co/bert-base-uncased", False),
+    ("https://huggingface.co/datasets/imdb", False),
+    # Non-supported / invalid inputs should score every device 0.0
+    ("https://example.com", True),
+    ("https://github.com/fake/fake", True),
+    ("not-a-url", True),
+])
+def test_size_metric(compute, url, expect_zero):
+    result = compute(SizeMetric, url)
     assert "size_score" in result
     ss = result["size_score"]
     assert isinstance(ss, dict)
-    for v in ss.values():
-        assert 0.0 <= float(v) <= 1.0
-
-def test_size_metric_non_supported():
-    metric = SizeMetric()
-    result = metric.calculate("https://example.com")
-    # Non-supported URLs should return a size_score dict with zeros
-    assert "size_score" in result
-    ss = result["size_score"]
-    assert all(float(v) == 0.0 for v in ss.values())
-
-def test_size_metric_invalid_repo():
-    metric = SizeMetric()
-    result = metric.calculate("https://github.com/fake/fake")
-    assert "size_score" in result
-    ss = result["size_score"]
-    assert all(float(v) == 0.0 for v in ss.values())
-
-def test_size_metric_non_url():
-    metric = SizeMetric()
-    result = metric.calculate("not-a-url")
-    assert "size_score" in result
-    ss = result["size_score"]
-    assert all(float(v) == 0.0 for v in ss.values())
+    if expect_zero:
+        assert all(float(v) == 0.0 for v in ss.values())
+    else:
+        for v in ss.values():
+            assert 0.0 <= float(v) <= 1.0
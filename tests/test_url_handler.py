@@ -1,26 +1,26 @@
 from phase2.repo2.cli.utils import MetadataFetcher
 
+# URL fixtures shared by the tests below, built once at import
+MODEL_URL = "https://huggingface.co/owner/model-name"
+DS_URL = "https://huggingface.co/datasets/owner/ds"
+GH_URL = "https://github.com/psf/requests"
 
-def test_classify_and_extract():
-    model_url = "https://huggingface.co/owner/model-name"
-    ds_url = "https://huggingface.co/datasets/owner/ds"
-    gh_url = "https://github.com/psf/requests"
 
-    assert MetadataFetcher.classify_url(model_url) == MetadataFetcher.MODEL
-    assert MetadataFetcher.classify_url(ds_url) == MetadataFetcher.DATABASE
-    assert MetadataFetcher.classify_url(gh_url) == MetadataFetcher.CODE
+def test_classify_and_extract():
+    assert MetadataFetcher.classify_url(MODEL_URL) == MetadataFetcher.MODEL
+    assert MetadataFetcher.classify_url(DS_URL) == MetadataFetcher.DATABASE
+    assert MetadataFetcher.classify_url(GH_URL) == MetadataFetcher.CODE
 
-    assert MetadataFetcher.extract_hf_id(model_url) == "owner/model-name"
-    assert MetadataFetcher.extract_hf_id(ds_url) == "owner/ds"
-    assert MetadataFetcher.extract_github_repo(gh_url) == "psf/requests"
+    assert MetadataFetcher.extract_hf_id(MODEL_URL) == "owner/model-name"
+    assert MetadataFetcher.extract_hf_id(DS_URL) == "owner/ds"
+    assert MetadataFetcher.extract_github_repo(GH_URL) == "psf/requests"
 
 
 def test_get_raw_readme_url_and_api_urls():
-    gh_url = "https://github.com/psf/requests"
-    raw = MetadataFetcher.get_raw_readme_url(gh_url, default_branch="main")
+    raw = MetadataFetcher.get_raw_readme_url(GH_URL, default_branch="main")
     assert "raw.githubusercontent.com" in raw or raw.endswith("README.md")
 
-    api = MetadataFetcher.get_api_url(gh_url)
+    api = MetadataFetcher.get_api_url(GH_URL)
     assert "api.github.com" in api
 
 